@@ -3,7 +3,7 @@
 import { useState, useEffect } from "react";
 import { Search } from "lucide-react";
 import { useAppContext } from "./context/AppContext";
-import { Tab, ScoutReport, LogEntry } from "../types";
+import { Tab, ScoutReport, LogEntry, JobEntry, ScoutEvent } from "../types";
 import { SidebarNav } from "../components/SidebarNav";
 import { LiveTrace } from "../components/LiveTrace";
 import { ProfileForm } from "../components/ProfileForm";
@@ -38,6 +38,14 @@ export default function Home() {
     setLogs(prev => [...prev.slice(-39), { timestamp, content, type }]);
   };
 
+  // Render matches as they are scored; the final result event replaces this partial report
+  const addScoredJob = (job: JobEntry) => {
+    setReport(prev => {
+      const jobs = [...(prev?.jobs ?? []), job].sort((a, b) => b.match_score - a.match_score);
+      return { summary: prev?.summary ?? "", jobs };
+    });
+  };
+
   const showToast = (message: string, type: 'error' | 'info' = 'error') => {
     const id = Date.now();
     setToasts(prev => [...prev, { id, message, type }]);
@@ -85,34 +93,79 @@ export default function Home() {
 
       if (!response.ok) throw new Error("Connection lost");
 
-      const reader = response.body?.getReader();
-      const decoder = new TextDecoder();
-      if (!reader) throw new Error("Reader initialization failed");
+      const handleEvent = (data: ScoutEvent) => {
+        if (data.type === "step") {
+          addLog(data.content, "step");
+        } else if (data.type === "queued") {
+          addLog(`Waiting for a free scout slot (position ${data.position} in queue)...`, "info");
+        } else if (data.type === "coalesced") {
+          addLog("An identical search is already running, joining it...", "info");
+        } else if (data.type === "jobs_found") {
+          addLog(`${data.source}: ${data.count} jobs found.`, "info");
+        } else if (data.type === "llm_queued") {
+          addLog(`AI rate limit reached, continuing in about ${Math.ceil(data.wait_seconds)}s...`, "info");
+        } else if (data.type === "job_scored") {
+          addScoredJob(data.content);
+        } else if (data.type === "result") {
+          setReport(data.content);
+          addLog("Final report ready.", "info");
+        } else if (data.type === "error") {
+          throw new Error(data.content);
+        }
+      };
+
+      // Numbered events let a dropped stream resume where it stopped instead of searching again
+      const sessionId = response.headers.get("X-Scout-Session");
+      let lastEventId = 0;
+      let finished = false;
+
+      const readStream = async (stream: Response) => {
+        const reader = stream.body?.getReader();
+        const decoder = new TextDecoder();
+        if (!reader) throw new Error("Reader initialization failed");
+
+        // Events can be split across reads; keep the trailing partial event for the next chunk
+        let buffer = "";
 
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) break;
 
-        const chunk = decoder.decode(value, { stream: true });
-        const lines = chunk.split("\n\n");
+          buffer += decoder.decode(value, { stream: true });
+          const chunks = buffer.split("\n\n");
+          buffer = chunks.pop() ?? "";
 
-        for (const line of lines) {
-          if (line.startsWith("data: ")) {
+          for (const chunk of chunks) {
+            let payload: string | null = null;
+            for (const line of chunk.split("\n")) {
+              if (line.startsWith("id: ")) lastEventId = Number(line.slice(4)) || lastEventId;
+              else if (line.startsWith("data: ")) payload = line.slice(6);
+            }
+            if (payload === null) continue;
             try {
-              const data = JSON.parse(line.replace("data: ", ""));
-              if (data.type === "step") {
-                addLog(data.content, "step");
-              } else if (data.type === "result") {
-                setReport(data.content);
-                addLog("Final report ready.", "info");
-              } else if (data.type === "error") {
-                throw new Error(data.content);
-              }
+              const data: ScoutEvent = JSON.parse(payload);
+              if (data.type === "result" || data.type === "error") finished = true;
+              handleEvent(data);
             } catch (err) {
               console.error("Stream parse error", err);
             }
           }
         }
+      };
+
+      try {
+        await readStream(response);
+      } catch (err) {
+        if (!sessionId) throw err;
+      }
+
+      if (!finished && sessionId) {
+        addLog("Connection dropped, resuming search...", "info");
+        const resumed = await fetch(`http://localhost:8000/api/v1/scout/${sessionId}/events`, {
+          headers: { "Last-Event-ID": String(lastEventId) },
+        });
+        if (!resumed.ok) throw new Error("Connection lost");
+        await readStream(resumed);
       }
 
     } catch (error: any) {
@@ -12,6 +12,7 @@ export interface JobEntry {
     seniority?: string;
     employment_type?: string;
     logo?: string;
+    sources?: string[];
 }
 
 export interface ScoutReport {
@@ -24,3 +25,24 @@ export interface LogEntry {
     content: string;
     type: 'step' | 'info' | 'error';
 }
+
+export interface ScoutTiming {
+    total_ms: number;
+    stages_ms: Record<string, number>;
+    sources_ms: Record<string, number>;
+    agents_ms: Record<string, number>;
+    tokens: { prompt: number; completion: number };
+    job_list_tokens: { verbose: number; compact: number; saved: number };
+}
+
+export type ScoutEvent =
+    | { type: 'session'; session_id: string }
+    | { type: 'queued'; position: number }
+    | { type: 'coalesced' }
+    | { type: 'step'; content: string }
+    | { type: 'llm_queued'; priority: 'interactive' | 'batch'; wait_seconds: number }
+    | { type: 'jobs_found'; source: string; count: number }
+    | { type: 'job_scored'; content: JobEntry }
+    | { type: 'timing'; content: ScoutTiming }
+    | { type: 'result'; content: ScoutReport }
+    | { type: 'error'; content: string };
@@ -1,55 +1,182 @@
-import json
 import asyncio
+import hashlib
+import json
 import threading
-from queue import Queue
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from app.model.schemas import ScoutRequest, ScoutResponse
-from scouthire_mas.crew import run_scouthire_crew
+from app.model.schemas import ScoutRequest, ScoutResponse, BatchScoutRequest
+from app.services.crew_runner import get_crew_runner
+from app.services.session_store import get_session_store
+from scouthire_mas.runtime import get_runtime, ScoutCancelled
+from scouthire_mas.tools.job_cache import get_job_cache, normalize_key
+from scouthire_mas.tools.job_index import SCRAPE_MODE, get_job_index
+from scouthire_mas.tools.match_cache import get_match_cache
 
 router = APIRouter()
 
-@router.post("/scout")
-async def scout_jobs(request: ScoutRequest):
-    def event_generator():
-        q = Queue()
-        
-        def step_callback(step):
-            # Capture step information. CrewAI steps vary, but we'll try to get the text.
-            try:
-                # 'step' is usually a StepObject or similar
-                msg = f"Agent working..."
-                if hasattr(step, 'description'):
-                    msg = step.description
-                elif isinstance(step, str):
-                    msg = step
-                
-                q.put(json.dumps({"type": "step", "content": str(msg)}))
-            except:
-                q.put(json.dumps({"type": "step", "content": "Agent processing step..."}))
-
-        def run_crew():
-            try:
-                result = run_scouthire_crew(
-                    query=request.query,
-                    location=request.location,
-                    candidate_profile=request.candidate_profile,
-                    step_callback=step_callback
-                )
-                q.put(json.dumps({"type": "result", "content": result}))
-            except Exception as e:
-                q.put(json.dumps({"type": "error", "content": str(e)}))
-            finally:
-                q.put(None) # Signal end
-
-        # Start crew in a background thread
-        thread = threading.Thread(target=run_crew)
-        thread.start()
-
-        while True:
-            item = q.get()
-            if item is None:
-                break
-            yield f"data: {item}\n\n"
+
+def format_sse(item) -> str:
+    # None is a keep-alive: an SSE comment line that clients ignore
+    if item is None:
+        return ": keep-alive\n\n"
+    seq, event = item
+    # Numbered events carry an id, which the client sends back as Last-Event-ID to resume
+    event_id = f"id: {seq}\n" if seq is not None else ""
+    return f"{event_id}data: {json.dumps(event)}\n\n"
+
+
+def stream_response(events) -> StreamingResponse:
+    async def event_generator():
+        async for item in events:
+            yield format_sse(item)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+def session_response(follower, events) -> StreamingResponse:
+    response = stream_response(events)
+    response.headers["X-Scout-Session"] = follower.flight.session_id
+    return response
+
+
+def request_key(kind: str, request) -> str:
+    """Canonical hash of a request: whitespace and the case of query/location don't make it distinct."""
+    def canonical(value):
+        if isinstance(value, dict):
+            return {k: canonical(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [canonical(v) for v in value]
+        return " ".join(value.split()) if isinstance(value, str) else value
+
+    payload = canonical(request.model_dump(exclude={"query", "location"}))
+    payload["search"] = normalize_key(request.query, request.location)
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{kind}:{digest}"
+
+
+def follow_or_start(key: str, work, kind: str = "scout"):
+    """Follow an identical run in progress, or reserve a crew slot and start one."""
+    runner = get_crew_runner()
+    follower = runner.join(key)
+    if follower is None:
+        follower = runner.start(key, reserve_crew_slot(), work, kind=kind)
+    return follower
+
+
+def reserve_crew_slot():
+    ticket = get_crew_runner().reserve()
+    if ticket is None:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many scouts in progress. Please retry shortly.",
+            headers={"Retry-After": "30"},
+        )
+    return ticket
+
+
+def make_step_callback(emit, cancelled: threading.Event):
+    def step_callback(step):
+        if cancelled.is_set():
+            raise ScoutCancelled()
+        # Capture step information. CrewAI steps vary, but we'll try to get the text.
+        try:
+            # 'step' is usually a StepObject or similar
+            msg = f"Agent working..."
+            if hasattr(step, 'description'):
+                msg = step.description
+            elif isinstance(step, str):
+                msg = step
+
+            emit({"type": "step", "content": str(msg)})
+        except:
+            emit({"type": "step", "content": "Agent processing step..."})
+    return step_callback
+
+
+@router.post("/scout")
+async def scout_jobs(request: ScoutRequest, http_request: Request):
+    runner = get_crew_runner()
+
+    def run_crew(emit, cancelled: threading.Event):
+        return get_runtime().run_scout(
+            query=request.query,
+            location=request.location,
+            candidate_profile=request.candidate_profile,
+            filters=request.filters,
+            step_callback=make_step_callback(emit, cancelled),
+            cancel_event=cancelled,
+            event_callback=emit,
+        )
+
+    follower = follow_or_start(request_key("scout", request), run_crew)
+    return session_response(follower, runner.follow(follower, http_request.is_disconnected))
+
+
+@router.post("/scout/batch")
+async def scout_jobs_batch(request: BatchScoutRequest, http_request: Request):
+    """Scrape once for query/location and match every profile against it, streaming per-profile results."""
+    runner = get_crew_runner()
+
+    def run_batch(emit, cancelled: threading.Event):
+        return get_runtime().run_batch(
+            query=request.query,
+            location=request.location,
+            profiles=[(profile.id, profile.candidate_profile) for profile in request.profiles],
+            filters=request.filters,
+            step_callback=make_step_callback(emit, cancelled),
+            cancel_event=cancelled,
+            event_callback=emit,
+        )
+
+    follower = follow_or_start(request_key("batch", request), run_batch, kind="batch")
+    return session_response(follower, runner.follow(follower, http_request.is_disconnected))
+
+
+@router.get("/scout/{session_id}")
+async def scout_session(session_id: str):
+    """Status of a scout session and, once done, its result."""
+    runner = get_crew_runner()
+    flight = runner.live_session(session_id)
+    if flight is not None and not flight.done:
+        return {"session_id": session_id, "kind": flight.kind, "status": "running", "result": None, "error": None, "events": len(flight.history)}
+    store = get_session_store()
+    await asyncio.to_thread(store.flush)
+    session = await asyncio.to_thread(store.get, session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired scout session.")
+    return session
+
+
+@router.get("/scout/{session_id}/events")
+async def scout_session_events(
+    session_id: str,
+    http_request: Request,
+    last_event_id: Optional[str] = Header(default=None),
+):
+    """Resume a session's event stream after Last-Event-ID (header, or `last_event_id` query parameter)."""
+    last_event_id = last_event_id or http_request.query_params.get("last_event_id")
+    try:
+        after = max(int(last_event_id or 0), 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Last-Event-ID must be an event number.")
+
+    runner = get_crew_runner()
+    follower = runner.resume(session_id, after)
+    if follower is not None:
+        return stream_response(runner.follow(follower, http_request.is_disconnected))
+
+    store = get_session_store()
+    await asyncio.to_thread(store.flush)
+    if await asyncio.to_thread(store.get, session_id) is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired scout session.")
+    return stream_response(runner.replay(session_id, after, http_request.is_disconnected))
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters for the scraped job listings and match score caches, used to size them."""
+    stats = {"jobs": get_job_cache().stats(), "match_scores": get_match_cache().stats()}
+    if SCRAPE_MODE == "index":
+        stats["index"] = get_job_index().stats()
+    return stats
@@ -1,8 +1,23 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import router as api_router
+from scouthire_mas.metrics import render_metrics
+from scouthire_mas.runtime import get_runtime
 
-app = FastAPI(title="ScoutHire API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    runtime = get_runtime()
+    # Build the shared LLM client and import CrewAI once per worker, off the startup path
+    runtime.warm_up_in_background()
+    runtime.start_ingestion()
+    yield
+    runtime.stop()
+
+
+app = FastAPI(title="ScoutHire API", version="1.0.0", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -11,6 +26,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Scout-Session"],  # lets the client resume a dropped stream
 )
 
 # Include the API routes
@@ -19,3 +35,9 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/")
 async def root():
     return {"message": "Welcome to ScoutHire API"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint for this worker."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -1,15 +1,34 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 
 class CandidateProfile(BaseModel):
     experience: str
     skills: str
     goals: str
 
+class ScoutFilters(BaseModel):
+    """Hard requirements checked before matching. Jobs that don't state a value still pass."""
+    min_salary: Optional[int] = Field(default=None, ge=0, description="Minimum annual salary, in the posting's currency")
+    max_age_days: Optional[int] = Field(default=None, ge=1)
+    seniority: Optional[List[Literal["intern", "junior", "mid", "senior", "lead", "manager"]]] = None
+    employment_types: Optional[List[Literal["full_time", "part_time", "contract", "internship", "temporary"]]] = None
+    remote_only: bool = False
+
 class ScoutRequest(BaseModel):
     query: str = "python"
     location: str = "Remote"
     candidate_profile: CandidateProfile
+    filters: Optional[ScoutFilters] = None
+
+class BatchProfile(BaseModel):
+    id: str
+    candidate_profile: CandidateProfile
+
+class BatchScoutRequest(BaseModel):
+    query: str = "python"
+    location: str = "Remote"
+    profiles: List[BatchProfile] = Field(..., min_length=1, max_length=50)
+    filters: Optional[ScoutFilters] = None
 
 class JobMatch(BaseModel):
     title: str
@@ -0,0 +1,373 @@
+import asyncio
+import os
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.session_store import TERMINAL_STATUSES, SessionStore, get_session_store
+
+from scouthire_mas.metrics import Metric
+from scouthire_mas.runtime import ScoutCancelled
+
+# Crews that may run at the same time in this worker. Each one holds a thread for its whole run.
+MAX_CONCURRENT_CREWS = int(os.getenv("SCOUTHIRE_MAX_CONCURRENT_CREWS", "4"))
+# Requests allowed to wait for a free crew slot before new ones are rejected with 429.
+MAX_QUEUED_CREWS = int(os.getenv("SCOUTHIRE_MAX_QUEUED_CREWS", "32"))
+# Seconds without an event before a keep-alive is sent and the client connection is re-checked.
+HEARTBEAT_INTERVAL = 15.0
+# Identical requests arriving while one is in progress follow its run instead of starting their own.
+COALESCE_REQUESTS = os.getenv("SCOUTHIRE_COALESCE_REQUESTS", "1") == "1"
+# Seconds a run keeps going after its last client disconnected, so the client can resume it.
+SESSION_GRACE = float(os.getenv("SCOUTHIRE_SESSION_GRACE", "30"))
+# Seconds between store reads when replaying a session another worker is running.
+SESSION_POLL_INTERVAL = 0.5
+
+Emit = Callable[[Dict[str, Any]], None]
+# (event number, event) as streamed to a client; the number is None for events that are not kept
+Numbered = Tuple[Optional[int], Dict[str, Any]]
+Work = Callable[[Emit, threading.Event], Any]
+
+
+class Ticket:
+    """A reserved place in the crew queue, handed from the endpoint to its stream."""
+
+
+class Flight:
+    """One crew run, recorded as a session and streamed to every request following it.
+
+    Events are numbered from 1 and kept, so identical requests joining late and clients
+    resuming after a dropped connection get everything after the last event they saw.
+    Keep-alives and stale `queued` positions are neither numbered nor kept.
+    """
+
+    def __init__(self, key: str, kind: str, store: Optional[SessionStore] = None):
+        self.key = key
+        self.kind = kind
+        self.session_id = uuid.uuid4().hex
+        self.store = store
+        self.history: List[Dict[str, Any]] = []
+        self.followers: "weakref.WeakSet[Follower]" = weakref.WeakSet()
+        self.done = False
+        self.task: Optional[asyncio.Task] = None
+        if store is not None:
+            store.create(self.session_id, kind)
+        self.publish({"type": "session", "session_id": self.session_id})
+
+    def publish(self, event: Optional[Dict[str, Any]]) -> None:
+        seq = None
+        if event is not None and event.get("type") != "queued":
+            self.history.append(event)
+            seq = len(self.history)
+            if self.store is not None:
+                self.store.append(self.session_id, seq, event)
+        for follower in list(self.followers):
+            follower.queue.put_nowait((seq, event) if event is not None else None)
+
+    def outcome(self) -> Tuple[str, Any, Optional[str]]:
+        """(status, result, error) from the last event."""
+        last = self.history[-1] if self.history else {}
+        if last.get("type") == "result":
+            return "done", last.get("content"), None
+        if last.get("type") == "error":
+            return "error", None, last.get("content")
+        return "cancelled", None, None
+
+
+class Follower:
+    """A request's subscription to a flight. Dropping it unsubscribes, like an abandoned ticket."""
+
+    def __init__(self, runner: "CrewRunner", flight: Flight, joined: bool = False, after: int = 0):
+        self.flight = flight
+        self.queue: asyncio.Queue = asyncio.Queue()
+        if joined:
+            self.queue.put_nowait((None, {"type": "coalesced"}))
+        for seq, event in enumerate(flight.history[after:], start=after + 1):
+            self.queue.put_nowait((seq, event))
+        if flight.done:
+            self.queue.put_nowait(None)
+        flight.followers.add(self)
+        self._finalizer = weakref.finalize(self, runner._leave, flight)
+
+    def close(self) -> None:
+        self.flight.followers.discard(self)
+        self._finalizer()
+
+
+class CrewRunner:
+    """Runs crews on a bounded thread pool and bridges their events onto the event loop.
+
+    All bookkeeping happens on the event loop thread, so no locks are needed. Only the
+    crew itself runs on a worker thread; the SSE stream never blocks a thread while waiting.
+    The queue holds weak references, so a ticket whose stream never started (client gone
+    before the response body was sent) drops out of the queue on its own.
+
+    Requests run as flights (`start`), which identical requests can `join` while in progress.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_CREWS,
+        max_queued: int = MAX_QUEUED_CREWS,
+        store: Optional[SessionStore] = None,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.active = 0
+        self._waiting: deque = deque()
+        self._changed: Optional[asyncio.Event] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="crew")
+        self.store = store
+        self._flights: Dict[str, Flight] = {}
+        self._sessions: Dict[str, Flight] = {}
+
+    @property
+    def queued(self) -> int:
+        self._prune()
+        return len(self._waiting)
+
+    def _prune(self) -> None:
+        if any(ref() is None for ref in self._waiting):
+            self._waiting = deque(ref for ref in self._waiting if ref() is not None)
+
+    def _position(self, ticket: Ticket) -> int:
+        self._prune()
+        return next(i for i, ref in enumerate(self._waiting) if ref() is ticket) + 1
+
+    def reserve(self) -> Optional[Ticket]:
+        """Take a place in the queue, or return None when the runner is full."""
+        if self.active + self.queued >= self.max_concurrent + self.max_queued:
+            CREWS_REJECTED.inc()
+            return None
+        ticket = Ticket()
+        self._waiting.append(weakref.ref(ticket))
+        return ticket
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def _wait_for_change(self) -> None:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        await self._changed.wait()
+
+    def _release(self) -> None:
+        self.active -= 1
+        self._notify()
+
+    async def stream(
+        self,
+        ticket: Ticket,
+        work: Work,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Wait for `ticket`'s turn, run `work(emit, cancelled)` on the pool and yield its events.
+
+        Yields `queued` events while waiting, then whatever `work` emits, then a final
+        `result` or `error` event. `None` is yielded as a keep-alive. Closing the
+        iterator (client disconnect) sets `cancelled` so the crew stops at its next step.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+        started = False
+        queued_at = time.perf_counter()
+
+        try:
+            # ---- Admission: wait in FIFO order for a free slot ----
+            last_position = None
+            while not (self._position(ticket) == 1 and self.active < self.max_concurrent):
+                position = self._position(ticket)
+                if position != last_position:
+                    last_position = position
+                    yield {"type": "queued", "position": position}
+                try:
+                    await asyncio.wait_for(self._wait_for_change(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    if is_disconnected and await is_disconnected():
+                        return
+                    yield None
+            self._waiting.popleft()
+            self.active += 1
+            started = True
+            QUEUE_WAIT_SECONDS.observe(time.perf_counter() - queued_at)
+            self._notify()
+
+            # ---- Run the crew on a pool thread, streaming its events back ----
+            def emit(event: Optional[Dict[str, Any]]) -> None:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+
+            def run() -> None:
+                try:
+                    emit({"type": "result", "content": work(emit, cancelled)})
+                except ScoutCancelled:
+                    print("--- Scout cancelled: client disconnected ---")
+                except Exception as e:
+                    emit({"type": "error", "content": str(e)})
+                finally:
+                    emit(None)
+
+            future = loop.run_in_executor(self._executor, run)
+            future.add_done_callback(lambda _: self._release())
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    if is_disconnected and await is_disconnected():
+                        return
+                    yield None
+                    continue
+                if event is None:
+                    break
+                yield event
+        finally:
+            cancelled.set()
+            if not started:
+                self._waiting = deque(ref for ref in self._waiting if ref() not in (ticket, None))
+                self._notify()
+
+
+    # ---- Coalescing identical requests ----
+    def join(self, key: str) -> Optional[Follower]:
+        """Follow the run already in progress for `key`, if there is one."""
+        flight = self._flights.get(key) if COALESCE_REQUESTS else None
+        if flight is None or flight.done:
+            return None
+        REQUESTS_COALESCED.inc()
+        return Follower(self, flight, joined=True)
+
+    def start(self, key: str, ticket: Ticket, work: Work, kind: str = "scout") -> Follower:
+        """Run `work` for `key` in the background and return the first follower of its events."""
+        flight = Flight(key, kind, self.store)
+        follower = Follower(self, flight)
+        if COALESCE_REQUESTS:
+            self._flights[key] = flight
+        self._sessions[flight.session_id] = flight
+        flight.task = asyncio.get_running_loop().create_task(self._fly(flight, ticket, work))
+        return follower
+
+    async def _fly(self, flight: Flight, ticket: Ticket, work: Work) -> None:
+        try:
+            async for event in self.stream(ticket, work):
+                # Followers send their own keep-alives
+                if event is not None:
+                    flight.publish(event)
+        finally:
+            flight.done = True
+            flight.publish(None)
+            if flight.store is not None:
+                flight.store.finish(flight.session_id, *flight.outcome())
+            self._forget(flight)
+
+    def _forget(self, flight: Flight) -> None:
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+        self._sessions.pop(flight.session_id, None)
+
+    def resume(self, session_id: str, after: int = 0) -> Optional[Follower]:
+        """Follow a run still in progress in this worker from event `after` on, if there is one."""
+        flight = self._sessions.get(session_id)
+        if flight is None or flight.done:
+            return None
+        return Follower(self, flight, after=after)
+
+    def live_session(self, session_id: str) -> Optional[Flight]:
+        return self._sessions.get(session_id)
+
+    @staticmethod
+    def _abandoned(flight: Flight) -> bool:
+        # Iterating skips followers that are being collected right now
+        return not any(True for _ in flight.followers) and not flight.done and flight.task is not None
+
+    def _leave(self, flight: Flight) -> None:
+        if not self._abandoned(flight):
+            return
+        if SESSION_GRACE > 0:
+            flight.task.get_loop().call_later(SESSION_GRACE, self._cancel_if_abandoned, flight)
+        else:
+            self._cancel_if_abandoned(flight)
+
+    def _cancel_if_abandoned(self, flight: Flight) -> None:
+        if self._abandoned(flight):
+            print(f"--- Session {flight.session_id} abandoned, cancelling its run ---")
+            flight.task.cancel()
+            self._forget(flight)
+
+    async def follow(
+        self,
+        follower: Follower,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncIterator[Optional[Numbered]]:
+        """Yield a flight's numbered events to one client, with keep-alives, until its result or error."""
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(follower.queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    if is_disconnected and await is_disconnected():
+                        return
+                    yield None
+                    continue
+                if event is None:
+                    return
+                yield event
+        finally:
+            follower.close()
+
+    async def replay(
+        self,
+        session_id: str,
+        after: int = 0,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncIterator[Optional[Numbered]]:
+        """Yield a stored session's events after `after`, polling while another worker still runs it."""
+        store = self.store
+        if store is None:
+            return
+        await asyncio.to_thread(store.flush)
+        idle = 0.0
+        while True:
+            # Status first: once it is terminal, the events read next are all there will be
+            session = await asyncio.to_thread(store.get, session_id)
+            for seq, event in await asyncio.to_thread(store.events, session_id, after):
+                after = seq
+                idle = 0.0
+                yield seq, event
+            if session is None or session["status"] in TERMINAL_STATUSES:
+                return
+            await asyncio.sleep(SESSION_POLL_INTERVAL)
+            idle += SESSION_POLL_INTERVAL
+            if idle >= HEARTBEAT_INTERVAL:
+                idle = 0.0
+                if is_disconnected and await is_disconnected():
+                    return
+                yield None
+
+
+_runner: Optional[CrewRunner] = None
+
+# ---- Metrics ----
+CREWS_ACTIVE = Metric(
+    "scouthire_crews_active", "gauge", "Crews running in this worker.",
+    collect=lambda: {(): get_crew_runner().active},
+)
+CREWS_QUEUED = Metric(
+    "scouthire_crews_queued", "gauge", "Requests waiting for a crew slot.",
+    collect=lambda: {(): get_crew_runner().queued},
+)
+CREWS_REJECTED = Metric("scouthire_crews_rejected_total", "counter", "Requests rejected with 429 because the queue was full.")
+REQUESTS_COALESCED = Metric("scouthire_requests_coalesced_total", "counter", "Requests that followed an identical run in progress.")
+QUEUE_WAIT_SECONDS = Metric("scouthire_queue_wait_seconds", "histogram", "Time a request waited for a crew slot.")
+
+
+def get_crew_runner() -> CrewRunner:
+    global _runner
+    if _runner is None:
+        _runner = CrewRunner(store=get_session_store())
+    return _runner
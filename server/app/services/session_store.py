@@ -0,0 +1,172 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Every scout run is a session: its events and final result are kept here so a client whose
+# stream dropped can fetch the result or resume the events instead of running the crew again.
+SESSION_DB = os.getenv("SCOUTHIRE_SESSION_DB", ".scouthire/sessions.db")
+# Seconds a finished (or abandoned) session stays retrievable.
+SESSION_TTL = float(os.getenv("SCOUTHIRE_SESSION_TTL", "3600"))
+# Seconds between eviction sweeps of the writer thread.
+EVICT_INTERVAL = 60.0
+
+TERMINAL_STATUSES = ("done", "error", "cancelled")
+
+
+class SessionStore:
+    """SQLite store of sessions and their numbered events.
+
+    Writes are queued and committed in batches by one daemon thread, so recording an event
+    never blocks the event loop. `flush()` waits until everything queued so far is on disk.
+    With a shared file, any worker can serve any session.
+    """
+
+    def __init__(self, path: str, ttl: float = SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._uri = path == "memory"
+        if self._uri:
+            self.path = f"file:scouthire-sessions-{id(self)}?mode=memory&cache=shared"
+        # Keeps a shared in-memory database alive, and serves as the writer's connection
+        self._conn = self._connect(check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, result TEXT, error TEXT, "
+            "events INTEGER NOT NULL DEFAULT 0, created REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_events ("
+            "session_id TEXT NOT NULL, seq INTEGER NOT NULL, data TEXT NOT NULL, "
+            "PRIMARY KEY (session_id, seq)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        self._writes: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="session-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10, uri=self._uri, check_same_thread=check_same_thread)
+
+    # ---- Writes (queued) ----
+    def create(self, session_id: str, kind: str) -> None:
+        self._writes.put(("create", session_id, kind, time.time()))
+
+    def append(self, session_id: str, seq: int, event: Dict[str, Any]) -> None:
+        self._writes.put(("event", session_id, seq, json.dumps(event), time.time()))
+
+    def finish(self, session_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        data = json.dumps(result) if result is not None else None
+        self._writes.put(("finish", session_id, status, data, error, time.time()))
+
+    def flush(self, timeout: float = 5.0) -> None:
+        done = threading.Event()
+        self._writes.put(("flush", done))
+        done.wait(timeout)
+
+    def _write_loop(self) -> None:
+        last_evicted = time.monotonic()
+        while True:
+            try:
+                batch = [self._writes.get(timeout=EVICT_INTERVAL)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < 500:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._apply(batch)
+            except Exception as e:
+                print(f"Error writing scout sessions: {e}")
+            finally:
+                for item in batch:
+                    if item[0] == "flush":
+                        item[1].set()
+            if time.monotonic() - last_evicted >= EVICT_INTERVAL:
+                last_evicted = time.monotonic()
+                try:
+                    self.evict()
+                except Exception as e:
+                    print(f"Error evicting scout sessions: {e}")
+
+    def _apply(self, batch: List[Tuple]) -> None:
+        conn = self._conn
+        with conn:
+            for item in batch:
+                op = item[0]
+                if op == "create":
+                    _, session_id, kind, now = item
+                    conn.execute(
+                        "INSERT OR IGNORE INTO sessions (id, kind, status, created, updated) VALUES (?, ?, 'running', ?, ?)",
+                        (session_id, kind, now, now),
+                    )
+                elif op == "event":
+                    _, session_id, seq, data, now = item
+                    conn.execute("INSERT OR REPLACE INTO session_events (session_id, seq, data) VALUES (?, ?, ?)", (session_id, seq, data))
+                    conn.execute("UPDATE sessions SET events = MAX(events, ?), updated = ? WHERE id = ?", (seq, now, session_id))
+                elif op == "finish":
+                    _, session_id, status, data, error, now = item
+                    conn.execute(
+                        "UPDATE sessions SET status = ?, result = ?, error = ?, updated = ? WHERE id = ?",
+                        (status, data, error, now, session_id),
+                    )
+
+    def evict(self) -> int:
+        """Drop sessions not updated for `ttl` seconds. Runs on the writer thread."""
+        cutoff = time.time() - self.ttl
+        with self._conn as conn:
+            conn.execute("DELETE FROM session_events WHERE session_id IN (SELECT id FROM sessions WHERE updated < ?)", (cutoff,))
+            evicted = conn.execute("DELETE FROM sessions WHERE updated < ?", (cutoff,)).rowcount
+        if evicted:
+            print(f"--- Evicted {evicted} expired scout sessions ---")
+        return evicted
+
+    # ---- Reads ----
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT kind, status, result, error, events, created, updated FROM sessions WHERE id = ? AND updated >= ?",
+                (session_id, time.time() - self.ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        kind, status, result, error, events, created, updated = row
+        return {
+            "session_id": session_id,
+            "kind": kind,
+            "status": status,
+            "result": json.loads(result) if result else None,
+            "error": error,
+            "events": events,
+            "created": created,
+            "updated": updated,
+        }
+
+    def events(self, session_id: str, after: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT seq, data FROM session_events WHERE session_id = ? AND seq > ? ORDER BY seq", (session_id, after)
+            ).fetchall()
+        return [(seq, json.loads(data)) for seq, data in rows]
+
+
+_session_store: Optional[SessionStore] = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """Process-wide session store at SCOUTHIRE_SESSION_DB (`memory` keeps sessions in-process)."""
+    global _session_store
+    with _session_store_lock:
+        if _session_store is None:
+            if SESSION_DB != "memory":
+                os.makedirs(os.path.dirname(SESSION_DB) or ".", exist_ok=True)
+            _session_store = SessionStore(SESSION_DB)
+        return _session_store
@@ -0,0 +1,116 @@
+"""A deterministic stand-in for the Gemini client, so crews run offline at a controlled speed."""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List
+
+from crewai.llms.base_llm import BaseLLM
+from pydantic import PrivateAttr
+
+JOBS_PATTERN = re.compile(r"Job postings \(JSON\):\n(\[.*?\])\n\n", re.S)
+PROFILE_PATTERN = re.compile(r"Candidate Profile:(.*?)\n\n", re.S)
+
+
+def _stable_int(text: str) -> int:
+    return int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest()[:4], "little")
+
+
+class FakeRateLimitError(RuntimeError):
+    """Shaped like Gemini's RESOURCE_EXHAUSTED error: code 429 and a RetryInfo delay in the details."""
+
+    code = 429
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            "429 RESOURCE_EXHAUSTED. {'error': {'code': 429, 'details': "
+            f"[{{'@type': 'type.googleapis.com/google.rpc.RetryInfo', 'retryDelay': '{retry_after:.0f}s'}}]}}}}"
+        )
+
+
+class FakeLLM(BaseLLM):
+    """Scores jobs in matcher prompts from a hash of (profile, title, company); answers anything else with a fixed line.
+
+    Each call sleeps `latency` +- `jitter` seconds and fails with probability `failure_rate`.
+    With `rpm_limit`, calls beyond that many in the last minute are rejected with a 429.
+    Token usage is estimated at four characters per token and tracked like a real provider.
+    """
+
+    latency: float = 0.5
+    jitter: float = 0.1
+    failure_rate: float = 0.0
+    seed: int = 0
+    rpm_limit: int = 0
+    calls: int = 0
+    rate_limited: int = 0
+    _rng: Any = PrivateAttr(default=None)
+    _call_lock: Any = PrivateAttr(default_factory=threading.Lock)
+    _recent: Any = PrivateAttr(default_factory=deque)
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def _admit(self) -> None:
+        """Sliding one-minute window, like a provider's per-minute quota."""
+        if not self.rpm_limit:
+            return
+        with self._call_lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 60.0:
+                self._recent.popleft()
+            if len(self._recent) >= self.rpm_limit:
+                self.rate_limited += 1
+                raise FakeRateLimitError(60.0 - (now - self._recent[0]))
+            self._recent.append(now)
+
+    def _plan(self):
+        with self._call_lock:
+            if self._rng is None:
+                self._rng = random.Random(self.seed)
+            self.calls += 1
+            return max(0.0, self._rng.gauss(self.latency, self.jitter)), self._rng.random() < self.failure_rate
+
+    @staticmethod
+    def _scores(prompt: str) -> Dict[str, Any]:
+        match = JOBS_PATTERN.search(prompt)
+        jobs: List[Dict[str, Any]] = json.loads(match.group(1)) if match else []
+        profile = PROFILE_PATTERN.search(prompt)
+        profile_text = profile.group(1) if profile else ""
+        matches = []
+        for job in jobs:
+            score = 30 + _stable_int(f"{profile_text}|{job.get('title')}|{job.get('company')}") % 70
+            # Like the real matcher, weak fits are left out
+            if score >= 45:
+                matches.append({"id": job.get("id"), "match_score": score, "match_reason": f"Deterministic fit {score}."})
+        return {"matches": matches}
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        prompt = messages if isinstance(messages, str) else "\n".join(str(m.get("content", "")) for m in messages)
+        self._admit()
+        delay, fail = self._plan()
+        time.sleep(delay)
+        if fail:
+            raise RuntimeError("Fake LLM failure")
+        if JOBS_PATTERN.search(prompt):
+            answer = f"Thought: I scored every posting.\nFinal Answer: {json.dumps(self._scores(prompt))}"
+        else:
+            answer = "These matches were scored by the offline benchmark model."
+        self._track_token_usage_internal({
+            "prompt_tokens": len(prompt) // 4,
+            "completion_tokens": len(answer) // 4,
+            "total_tokens": (len(prompt) + len(answer)) // 4,
+            "successful_requests": 1,
+        })
+        return answer
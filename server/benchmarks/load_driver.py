@@ -0,0 +1,157 @@
+"""Open many concurrent SSE streams against /api/v1/scout and summarize what the clients saw.
+
+    python benchmarks/load_driver.py --url http://127.0.0.1:8000 --requests 50 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+QUERIES = ["python", "backend engineer", "data engineer", "frontend developer", "devops"]
+PROFILES = [
+    {"experience": "5 years backend", "skills": "Python, Django, PostgreSQL", "goals": "Senior backend role"},
+    {"experience": "3 years data", "skills": "Python, Spark, Airflow", "goals": "Data engineering"},
+    {"experience": "2 years frontend", "skills": "React, TypeScript, CSS", "goals": "Product-focused frontend"},
+    {"experience": "8 years infra", "skills": "AWS, Terraform, Kubernetes, Go", "goals": "Platform team lead"},
+    {"experience": "Graduate", "skills": "Java, Python, SQL", "goals": "First engineering job"},
+]
+LOCATIONS = ["Remote", "USA", "Europe"]
+
+
+def scout_payload(i: int) -> Dict[str, Any]:
+    """Request `i` of a run: queries, profiles and locations rotate so caches see realistic reuse."""
+    return {
+        "query": QUERIES[i % len(QUERIES)],
+        "location": LOCATIONS[i % len(LOCATIONS)],
+        "candidate_profile": PROFILES[i % len(PROFILES)],
+    }
+
+
+async def one_scout(client: httpx.AsyncClient, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Stream one scout and record when each event arrived, relative to the request start."""
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"status": None, "events": [], "error": None, "jobs": 0}
+    try:
+        async with client.stream("POST", url, json=payload) as response:
+            record["status"] = response.status_code
+            if response.status_code != 200:
+                await response.aread()
+                return record
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[6:])
+                record["events"].append((time.perf_counter() - started, event["type"]))
+                if event["type"] == "result":
+                    record["jobs"] = len(event["content"].get("jobs", []))
+                elif event["type"] == "error":
+                    record["error"] = event["content"]
+                elif event["type"] == "timing":
+                    record["timing"] = event.get("content")
+    except httpx.HTTPError as e:
+        record["error"] = repr(e)
+    record["elapsed"] = time.perf_counter() - started
+    return record
+
+
+async def run_load(base_url: str, requests: int, concurrency: int, timeout: float = 300.0) -> Dict[str, Any]:
+    """Send `requests` scouts, at most `concurrency` streams open at once."""
+    url = f"{base_url.rstrip('/')}/api/v1/scout"
+    gate = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        async def bounded(i: int) -> Dict[str, Any]:
+            async with gate:
+                return await one_scout(client, url, scout_payload(i))
+
+        started = time.perf_counter()
+        records = await asyncio.gather(*(bounded(i) for i in range(requests)))
+        wall = time.perf_counter() - started
+    return {"records": records, "wall": wall}
+
+
+def percentiles(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1], 3)}
+
+
+def _first(events, kind: str) -> Optional[float]:
+    return next((t for t, event_type in events if event_type == kind), None)
+
+
+def _last(events, kind: str) -> Optional[float]:
+    return next((t for t, event_type in reversed(events) if event_type == kind), None)
+
+
+def summarize(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Latency percentiles, time-to-first-event, throughput and client-side stage breakdown."""
+    records = run["records"]
+    done = [r for r in records if r["status"] == 200 and _first(r["events"], "result") is not None]
+    milestones = {"first_event": [], "scrape_done": [], "first_score": [], "result": []}
+    stages = {"scrape": [], "matching": [], "assembly": []}
+    # As reported by the server's `timing` event, in milliseconds
+    server_stages: Dict[str, List[float]] = {}
+    tokens = {"prompt": 0, "completion": 0}
+    for r in done:
+        events = r["events"]
+        result = _first(events, "result")
+        scraped = _last(events, "jobs_found")
+        first_score = _first(events, "job_scored")
+        last_score = _last(events, "job_scored")
+        milestones["first_event"].append(events[0][0])
+        milestones["result"].append(result)
+        if scraped is not None:
+            milestones["scrape_done"].append(scraped)
+            # Includes any wait for a crew slot
+            stages["scrape"].append(scraped)
+        if first_score is not None:
+            milestones["first_score"].append(first_score)
+        if scraped is not None and last_score is not None:
+            stages["matching"].append(last_score - scraped)
+            stages["assembly"].append(result - last_score)
+        timing = r.get("timing") or {}
+        for name, value in {**timing.get("stages_ms", {}), **timing.get("agents_ms", {})}.items():
+            server_stages.setdefault(name, []).append(value)
+        for kind in tokens:
+            tokens[kind] += timing.get("tokens", {}).get(kind, 0)
+    return {
+        "requests": len(records),
+        "completed": len(done),
+        "rejected_429": sum(1 for r in records if r["status"] == 429),
+        "errors": sum(1 for r in records if r["error"]),
+        "wall_seconds": round(run["wall"], 3),
+        "throughput_per_second": round(len(done) / run["wall"], 3) if run["wall"] else 0.0,
+        "latency": percentiles(milestones["result"]),
+        "time_to_first_event": percentiles(milestones["first_event"]),
+        "milestones": {name: percentiles(values) for name, values in milestones.items()},
+        "stages": {name: percentiles(values) for name, values in stages.items()},
+        "server_stages_ms": {name: percentiles(values) for name, values in server_stages.items()},
+        "llm_tokens": tokens,
+        "coalesced": sum(1 for r in records if _first(r["events"], "coalesced") is not None),
+        "llm_queued_events": sum(1 for r in records for _, event_type in r["events"] if event_type == "llm_queued"),
+        "mean_jobs_per_result": round(sum(r["jobs"] for r in done) / len(done), 2) if done else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive concurrent SSE scouts against a running API.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    run = asyncio.run(run_load(args.url, args.requests, args.concurrency))
+    print(json.dumps(summarize(run), indent=2))
+
+
+if __name__ == "__main__":
+    main()
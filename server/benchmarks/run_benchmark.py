@@ -0,0 +1,195 @@
+"""Offline end-to-end benchmark: stub job boards, the API on the fake LLM, and a load driver.
+
+    python benchmarks/run_benchmark.py --requests 40 --concurrency 20
+    python benchmarks/run_benchmark.py --board-error-rate 0.1 --json results.json
+
+Nothing leaves the machine. Caches are disabled unless --warm-caches is given, so every
+scout pays for scraping and matching.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_driver import run_load, summarize
+from stub_boards import BoardBehaviour, StubBoards
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of a process in MB (Linux /proc only)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class MemorySampler:
+    def __init__(self, pid: int, interval: float = 0.2):
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            value = rss_mb(self.pid)
+            if value is not None:
+                self.samples.append(value)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "MemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        if not self.samples:
+            return {}
+        return {"start_mb": round(self.samples[0], 1), "peak_mb": round(max(self.samples), 1), "end_mb": round(self.samples[-1], 1)}
+
+
+def wait_until_up(base_url: str, process: subprocess.Popen, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"API server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("API server did not start in time")
+
+
+def scrape_metrics(base_url: str, prefixes=("scouthire_llm_throttled_total", "scouthire_scouts_total", "scouthire_requests_coalesced_total")) -> Dict[str, float]:
+    """Selected counters from the server's /metrics, summed over labels."""
+    totals: Dict[str, float] = {}
+    try:
+        text = httpx.get(f"{base_url}/metrics", timeout=5.0).text
+    except httpx.HTTPError:
+        return totals
+    for line in text.splitlines():
+        name = line.split("{")[0].split(" ")[0]
+        if name in prefixes:
+            totals[name] = totals.get(name, 0.0) + float(line.rsplit(" ", 1)[1])
+    return totals
+
+
+def server_env(args, boards: StubBoards, workdir: str) -> Dict[str, str]:
+    env = {**os.environ, **boards.env()}
+    env.update({
+        "SCOUTHIRE_MAX_CONCURRENT_CREWS": str(args.max_crews),
+        "SCOUTHIRE_MAX_QUEUED_CREWS": str(args.max_queued),
+        "SCOUTHIRE_MATCH_CACHE_DB": "memory",
+        "SCOUTHIRE_INDEX_DB": os.path.join(workdir, "job_index.db"),
+        "SCOUTHIRE_SESSION_DB": os.path.join(workdir, "sessions.db"),
+        "SCOUTHIRE_INGEST_INTERVAL": "3600",
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "PYTHONUNBUFFERED": "1",
+    })
+    env.pop("SCOUTHIRE_JOB_CACHE_DB", None)
+    if not args.warm_caches:
+        env.update({"SCOUTHIRE_JOB_CACHE_TTL": "0", "SCOUTHIRE_JOB_CACHE_STALE_TTL": "0", "SCOUTHIRE_MATCH_CACHE_TTL": "0"})
+    if args.scrape_mode:
+        env["SCOUTHIRE_SCRAPE_MODE"] = args.scrape_mode
+    if args.llm_rpm:
+        env["SCOUTHIRE_LLM_RPM"] = str(args.llm_rpm)
+    return env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the offline ScoutHire benchmark.")
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--board-latency", type=float, default=0.3)
+    parser.add_argument("--board-jitter", type=float, default=0.1)
+    parser.add_argument("--board-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--llm-jitter", type=float, default=0.1)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rpm-limit", type=int, default=0, help="simulated provider quota (429s beyond it)")
+    parser.add_argument("--llm-rpm", type=float, help="scheduler budget (SCOUTHIRE_LLM_RPM)")
+    parser.add_argument("--max-crews", type=int, default=4)
+    parser.add_argument("--max-queued", type=int, default=64)
+    parser.add_argument("--scrape-mode", choices=["live", "index"])
+    parser.add_argument("--warm-caches", action="store_true", help="keep job and match caches enabled")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--server-log", help="keep the API server output in this file")
+    args = parser.parse_args()
+
+    boards = StubBoards(
+        behaviour=BoardBehaviour(args.board_latency, args.board_jitter, args.board_error_rate),
+        seed=args.seed,
+    ).start()
+    base_url = f"http://127.0.0.1:{args.port}"
+    workdir = tempfile.mkdtemp(prefix="scouthire-bench-")
+    log_path = args.server_log or os.path.join(workdir, "server.log")
+
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(
+            [
+                sys.executable, os.path.join(SERVER_DIR, "benchmarks", "serve.py"),
+                "--port", str(args.port),
+                "--llm-latency", str(args.llm_latency),
+                "--llm-jitter", str(args.llm_jitter),
+                "--llm-failure-rate", str(args.llm_failure_rate),
+                "--llm-rpm-limit", str(args.llm_rpm_limit),
+                "--seed", str(args.seed),
+            ],
+            cwd=workdir,
+            env=server_env(args, boards, workdir),
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        try:
+            started = time.perf_counter()
+            wait_until_up(base_url, process)
+            startup = time.perf_counter() - started
+            # One scout to finish warm-up (CrewAI import, first crew) before measuring
+            asyncio.run(run_load(base_url, 1, 1))
+            with MemorySampler(process.pid) as memory:
+                run = asyncio.run(run_load(base_url, args.requests, args.concurrency))
+            server_metrics = scrape_metrics(base_url)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+            boards.stop()
+
+    report = summarize(run)
+    report["server_startup_seconds"] = round(startup, 3)
+    report["memory"] = memory.stats()
+    report["boards"] = boards.stats()
+    report["server_metrics"] = server_metrics
+    report["config"] = {k: v for k, v in vars(args).items() if k not in ("json", "server_log")}
+    print(json.dumps(report, indent=2))
+    print(f"Server log: {log_path}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
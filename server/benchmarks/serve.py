@@ -0,0 +1,41 @@
+"""Run the API with the fake LLM. Job board URLs and cache settings come from the environment.
+
+    python benchmarks/serve.py --port 8100 --llm-latency 0.5
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import uvicorn
+
+from fake_llm import FakeLLM
+from scouthire_mas.runtime import get_runtime
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the ScoutHire API backed by the fake LLM.")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--llm-jitter", type=float, default=0.1)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rpm-limit", type=int, default=0, help="simulated provider quota; 0 for none")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    get_runtime().set_llm(FakeLLM(
+        model="fake/deterministic",
+        latency=args.llm_latency,
+        jitter=args.llm_jitter,
+        failure_rate=args.llm_failure_rate,
+        rpm_limit=args.llm_rpm_limit,
+        seed=args.seed,
+    ))
+    from app.main import app
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure what a worker pays before a scout reaches its first LLM call.
+
+Run from the server directory:  python benchmarks/setup_overhead.py
+No API key or network access is needed; nothing is sent to the LLM.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROUNDS = 50
+
+
+class Profile:
+    experience = "5 years backend"
+    skills = "Python, FastAPI, PostgreSQL"
+    goals = "Senior backend role"
+
+
+JOBS = [{"title": f"Backend Engineer {i}", "company": "Acme", "link": f"https://example.com/{i}", "local_score": 50} for i in range(8)]
+
+
+def time_import(module: str) -> float:
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure(label: str, setup) -> None:
+    first = time.perf_counter()
+    setup()
+    first = time.perf_counter() - first
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        setup()
+        samples.append(time.perf_counter() - started)
+    print(f"{label:<44} first {first * 1000:9.1f} ms   then median {statistics.median(samples) * 1000:7.2f} ms")
+
+
+def main() -> None:
+    print(f"{'cold import app.main (worker start)':<44} {time_import('app.main'):.2f} s")
+    print(f"{'cold import crewai':<44} {time_import('crewai'):.2f} s")
+
+    from crewai import Crew, LLM
+    from dotenv import load_dotenv
+    from scouthire_mas.agents.a_job_scraper import create_job_scraper_agent, create_job_task
+    from scouthire_mas.agents.b_candidate_matcher import create_candidate_matcher_agent, create_matching_task, create_scoring_task
+    from scouthire_mas.agents.c_aggregator import create_aggregator_agent, create_aggregation_task
+    from scouthire_mas.crew import format_profile
+    from scouthire_mas.runtime import ScoutRuntime
+    from scouthire_mas.tools.job_compact import compact_jobs, dumps
+
+    profile_text = format_profile(Profile())
+    # The prompt's job list as crew.score_chunk builds it
+    jobs_json = dumps(compact_jobs(JOBS)[0])
+
+    def legacy_agents_setup():
+        # What run_scouthire_crew did on every call in agents mode
+        load_dotenv()
+        llm = LLM(model="gemini/gemini-2.5-flash", temperature=0.1)
+        scraper = create_job_scraper_agent(llm, None, Profile())
+        matcher = create_candidate_matcher_agent(llm)
+        aggregator = create_aggregator_agent(llm)
+        tasks = [create_job_task(scraper, "python", "remote"), create_matching_task(matcher, profile_text), create_aggregation_task(aggregator)]
+        Crew(agents=[scraper, matcher, aggregator], tasks=tasks, share_crew=False)
+
+    def legacy_direct_setup():
+        load_dotenv()
+        llm = LLM(model="gemini/gemini-2.5-flash", temperature=0.1)
+        matcher = create_candidate_matcher_agent(llm)
+        Crew(agents=[matcher], tasks=[create_scoring_task(matcher, profile_text, jobs_json)], share_crew=False)
+
+    runtime = ScoutRuntime()
+
+    def runtime_direct_setup():
+        # Per request now: only the chunk's agent, task and crew; the LLM client is shared
+        matcher = create_candidate_matcher_agent(runtime.llm)
+        Crew(agents=[matcher], tasks=[create_scoring_task(matcher, profile_text, jobs_json)], share_crew=False)
+
+    measure("before: per-request setup (agents mode)", legacy_agents_setup)
+    measure("before: per-request setup (direct mode)", legacy_direct_setup)
+    measure("after: per-request setup (direct mode)", runtime_direct_setup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Local stand-ins for the job board APIs, replaying recorded payloads.
+
+Each board is served under /<source>/..., e.g. /jobicy/remote-jobs, with its own latency
+and error rate. Point the scraper at them with the environment from `StubBoards.env()`.
+"""
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "sources")
+
+# Board name -> environment variable holding its API root
+URL_VARIABLES = {
+    "jobicy": "SCOUTHIRE_JOBICY_URL",
+    "remotive": "SCOUTHIRE_REMOTIVE_URL",
+    "arbeitnow": "SCOUTHIRE_ARBEITNOW_URL",
+    "hackernews": "SCOUTHIRE_HN_URL",
+}
+
+
+class BoardBehaviour:
+    """Latency (seconds, normally distributed) and the share of requests answered with a 503."""
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.05, error_rate: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+
+
+class StubBoards:
+    def __init__(
+        self,
+        fixtures: str = FIXTURES,
+        behaviour: Optional[BoardBehaviour] = None,
+        overrides: Optional[Dict[str, BoardBehaviour]] = None,
+        seed: int = 0,
+        port: int = 0,
+    ):
+        self.payloads = {name: self._load(fixtures, name) for name in URL_VARIABLES}
+        self.behaviour = behaviour or BoardBehaviour()
+        self.overrides = overrides or {}
+        self.requests = {name: 0 for name in URL_VARIABLES}
+        self.errors = {name: 0 for name in URL_VARIABLES}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _load(fixtures: str, name: str) -> List[Dict[str, Any]]:
+        with open(os.path.join(fixtures, f"{name}.json"), encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, list) else [data]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> Dict[str, str]:
+        return {variable: f"{self.base_url}/{name}" for name, variable in URL_VARIABLES.items()}
+
+    def _plan(self, name: str):
+        """Decide (delay, fail) for one request, reproducibly for a given seed."""
+        behaviour = self.overrides.get(name, self.behaviour)
+        with self._lock:
+            self.requests[name] += 1
+            delay = max(0.0, self._rng.gauss(behaviour.latency, behaviour.jitter))
+            fail = self._rng.random() < behaviour.error_rate
+            if fail:
+                self.errors[name] += 1
+        return delay, fail
+
+    def _handler(self):
+        boards = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                name = url.path.strip("/").split("/", 1)[0]
+                if name not in boards.payloads:
+                    self.send_error(404)
+                    return
+                delay, fail = boards._plan(name)
+                time.sleep(delay)
+                if fail:
+                    self.send_error(503)
+                    return
+                pages = boards.payloads[name]
+                page = int(parse_qs(url.query).get("page", ["1"])[0])
+                body = json.dumps(pages[page - 1] if page <= len(pages) else {}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubBoards":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-boards", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requests": dict(self.requests), "errors": dict(self.errors)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve recorded job board payloads locally.")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    boards = StubBoards(behaviour=BoardBehaviour(args.latency, args.jitter, args.error_rate), port=args.port).start()
+    for variable, url in boards.env().items():
+        print(f"export {variable}={url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        boards.stop()
@@ -1,10 +1,21 @@
 from crewai import Agent, Task, LLM
-from typing import Callable, Optional
-from tools.scrape_jobs_tool import ScrapeJobsTool
+from typing import Any, Callable, Dict, Optional
+from scouthire_mas.tools.scrape_jobs_tool import ScrapeJobsTool
 
 
-def create_job_scraper_agent(llm: LLM, step_callback: Optional[Callable] = None) -> Agent:
-    """Create the Job Scraper agent."""
+def create_job_scraper_agent(
+    llm: LLM,
+    step_callback: Optional[Callable] = None,
+    candidate_profile: Optional[Any] = None,
+    on_source: Optional[Callable] = None,
+    on_catalog: Optional[Callable[[Dict[str, Any]], None]] = None,
+    filters: Optional[Any] = None,
+) -> Agent:
+    """Create the Job Scraper agent. With a candidate_profile, scraped jobs are pre-ranked locally.
+
+    With `on_catalog`, the tool hands the agents compact jobs and calls `on_catalog` with id -> full job.
+    `filters` are the request's hard filters, applied by the tool before any job reaches an agent.
+    """
     return Agent(
         role="Job Scraper",
         goal="Actively search, scrape, and structure job postings to provide immediate and accurate results.",
@@ -15,7 +26,7 @@ def create_job_scraper_agent(llm: LLM, step_callback: Optional[Callable] = None)
         ),
         verbose=True,
         llm=llm,
-        tools=[ScrapeJobsTool()],
+        tools=[ScrapeJobsTool(candidate_profile=candidate_profile, on_source=on_source, on_catalog=on_catalog, filters=filters)],
         step_callback=step_callback
     )
 
@@ -25,10 +36,8 @@ def create_job_task(agent: Agent, query: str, location: str) -> Task:
     return Task(
         description=(
             f"Search for '{query}' jobs in '{location}' using the 'Scrape Jobs' tool. "
-            "Extract job title, company, location, salary, date_posted, logo, seniority level (e.g. Entry, Senior), "
-            "employment type (e.g. Full Time, Contract), and application link. "
-            "Normalize results into a structured list of dictionaries."
+            "Return the tool's job list as compact JSON, keeping every job's 'id' and fields exactly as given."
         ),
         agent=agent,
-        expected_output="A list of job dictionaries with title, company, location, salary, date_posted, logo, seniority, employment_type, and link.",
+        expected_output="A JSON list of job objects, each with its 'id'.",
     )
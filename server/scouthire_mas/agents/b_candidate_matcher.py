@@ -1,5 +1,16 @@
 from crewai import Agent, Task, LLM
-from typing import Callable, Optional
+from typing import Callable, List, Optional
+from pydantic import BaseModel, Field
+
+
+class MatchResult(BaseModel):
+    id: str = Field(..., description="The id of the scored job (e.g. 'j3'), copied exactly from the input.")
+    match_score: int = Field(..., description="A score from 1-100 indicating how well the job matches the candidate.")
+    match_reason: str = Field(..., description="A brief explanation of why this job is a good fit.")
+
+
+class MatchResults(BaseModel):
+    matches: List[MatchResult] = Field(..., description="One entry per matched job.")
 
 
 def create_candidate_matcher_agent(llm: LLM, step_callback: Optional[Callable] = None) -> Agent:
@@ -25,9 +36,31 @@ def create_matching_task(agent: Agent, profile_text: str) -> Task:
             "Analyze the provided list of job postings and compare them with the following candidate profile:\n"
             f"{profile_text}\n\n"
             "Identify jobs where the candidate's skills and experience are a strong match. "
-            "For each match, include the match_score (1-100) and match_reason. Ensure 'logo', 'date_posted', 'seniority', and 'employment_type' are preserved.\n"
-            "CRITICAL LOCATION RULE: If a job is marked as 'Remote' or 'Remote (Global)', it is a VALID match regardless of the candidate's specific location preference (e.g. USA), unless the job explicitly excludes that region. Do NOT reject remote jobs just because the company is based in another country (e.g. Germany)."
+            "Jobs arrive pre-ranked by a local keyword scorer ('local_score', 1-100); use it as a hint, not as the answer. "
+            "For each match, return its 'id' exactly as given, a 'match_score' (1-100) and a one-sentence 'match_reason'. "
+            "Do not repeat any other job fields.\n"
+            "Every job already meets the location and hard requirements; judge fit only."
+        ),
+        agent=agent,
+        expected_output="A JSON object with a 'matches' list of {id, match_score, match_reason}.",
+        output_pydantic=MatchResults,
+    )
+
+
+def create_scoring_task(agent: Agent, profile_text: str, jobs_json: str) -> Task:
+    """Create a matching task that scores an explicit (compacted) job list and returns structured MatchResults."""
+    return Task(
+        description=(
+            "Score the following job postings against this candidate profile:\n"
+            f"{profile_text}\n\n"
+            f"Job postings (JSON):\n{jobs_json}\n\n"
+            "Identify jobs where the candidate's skills and experience are a strong match. "
+            "For each match, return its 'id' exactly as given, a 'match_score' (1-100) and a one-sentence 'match_reason'. "
+            "Jobs carry a 'local_score' (1-100) from a keyword scorer; use it as a hint, not as the answer. "
+            "Do not repeat any other job fields.\n"
+            "Every job already meets the location and hard requirements; judge fit only."
         ),
         agent=agent,
-        expected_output="A JSON list of matched jobs, each including 'match_score' and 'match_reason'.",
+        expected_output="A JSON object with a 'matches' list of {id, match_score, match_reason}.",
+        output_pydantic=MatchResults,
     )
@@ -1,8 +1,10 @@
 from crewai import Agent, Task, LLM
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional
 from pydantic import BaseModel, Field
 from typing import List
 
+from scouthire_mas.agents.b_candidate_matcher import MatchResult
+
 
 class JobMatch(BaseModel):
     title: str = Field(..., description="The title of the job.")
@@ -16,6 +18,7 @@ class JobMatch(BaseModel):
     employment_type: Optional[str] = Field(None, description="The employment type (e.g. 'Full Time', 'Contract', 'Freelance').")
     logo: Optional[str] = Field(None, description="The URL of the company logo.")
     link: str = Field(..., description="The application link URL.")
+    sources: Optional[List[str]] = Field(None, description="Every job board listing this job.")
 
 
 class ScoutReport(BaseModel):
@@ -23,6 +26,11 @@ class ScoutReport(BaseModel):
     jobs: List[JobMatch] = Field(..., description="A list of matched job opportunities.")
 
 
+class AggregatedMatches(BaseModel):
+    summary: str = Field(..., description="A brief overview of the search results.")
+    matches: List[MatchResult] = Field(..., description="The matched jobs, best first, keyed by job id.")
+
+
 def create_aggregator_agent(llm: LLM, step_callback: Optional[Callable] = None) -> Agent:
     """Create the Report Aggregator agent."""
     return Agent(
@@ -43,14 +51,68 @@ def create_aggregation_task(agent: Agent) -> Task:
     """Create the report aggregation task."""
     return Task(
         description=(
-            "Generate a comprehensive job scouting report in strictly structured JSON format. "
+            "Generate a job scouting report in strictly structured JSON format. "
             "The report must contain: "
             "1. A 'summary' string providing a high-level overview of the matches found. "
-            "2. A 'jobs' array where each item is a JSON object containing: 'title', 'company', 'location', 'salary', 'seniority', 'employment_type', 'date_posted', 'logo', 'match_score' (int), 'match_reason', and 'link'. "
-            "DO NOT include markdown separators, markdown buttons, or any non-JSON data. "
-            "The output must strictly conform to the ScoutReport Pydantic schema."
+            "2. A 'matches' array, best match first, where each item copies a matched job's 'id', 'match_score' (int) and 'match_reason'. "
+            "Job details (title, company, link, logo, ...) are filled in from the ids afterwards; do not repeat them. "
+            "DO NOT include markdown separators, markdown buttons, or any non-JSON data."
         ),
         agent=agent,
-        expected_output="A structured JSON object containing a summary and a list of matched jobs with date_posted, seniority, employment_type, and logo.",
-        output_pydantic=ScoutReport
+        expected_output="A structured JSON object with a summary and a list of {id, match_score, match_reason}.",
+        output_pydantic=AggregatedMatches
+    )
+
+
+def _to_job_match(job: Dict[str, Any], match_score: int, match_reason: str) -> JobMatch:
+    return JobMatch(
+        title=job.get("title") or "Not specified",
+        company=job.get("company") or "Not specified",
+        location=job.get("location") or "Not specified",
+        salary=str(job.get("salary") or "Not specified"),
+        match_score=max(1, min(100, int(match_score))),
+        match_reason=match_reason,
+        date_posted=str(job["date_posted"]) if job.get("date_posted") else None,
+        seniority=job.get("seniority"),
+        employment_type=job.get("employment_type"),
+        logo=job.get("logo"),
+        link=job.get("link") or "",
+        sources=job.get("sources") or ([job["source"]] if job.get("source") else None),
     )
+
+
+def build_summary(query: str, location: str, jobs: List[JobMatch]) -> str:
+    """Template summary used when no LLM summary is requested."""
+    if not jobs:
+        return f"No strong matches were found for '{query}' in '{location}'. Try broadening the search or your profile."
+    top = jobs[0]
+    strong = sum(1 for job in jobs if job.match_score >= 75)
+    return (
+        f"Found {len(jobs)} matching '{query}' roles in '{location}', {strong} of them strong matches (75+). "
+        f"Top match: {top.title} at {top.company} ({top.match_score}/100)."
+    )
+
+
+def assemble_report(
+    scraped_jobs: List[Dict[str, Any]],
+    matches: List[Dict[str, Any]],
+    summary: Optional[str] = None,
+    query: str = "",
+    location: str = "",
+) -> ScoutReport:
+    """Build the ScoutReport in Python from the matcher's scores, merging scraped fields back in by link.
+
+    Matches whose link does not belong to a scraped job are dropped.
+    """
+    by_link = {job.get("link"): job for job in scraped_jobs if job.get("link")}
+    jobs = []
+    seen = set()
+    for match in matches:
+        link = match.get("link")
+        if link not in by_link or link in seen:
+            continue
+        seen.add(link)
+        jobs.append(_to_job_match(by_link[link], match.get("match_score", 0), match.get("match_reason", "")))
+
+    jobs.sort(key=lambda job: job.match_score, reverse=True)
+    return ScoutReport(summary=summary or build_summary(query, location, jobs), jobs=jobs)
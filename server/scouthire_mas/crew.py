@@ -1,70 +1,442 @@
-import sys
 import os
-from typing import Any, Dict, List, Optional, Callable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from crewai import Crew, LLM
-from dotenv import load_dotenv
-
-# Add the scouthire_mas directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import agent and task factory functions
-from agents.a_job_scraper import create_job_scraper_agent, create_job_task
-from agents.b_candidate_matcher import create_candidate_matcher_agent, create_matching_task
-from agents.c_aggregator import create_aggregator_agent, create_aggregation_task, ScoutReport
+from scouthire_mas.agents.a_job_scraper import create_job_scraper_agent, create_job_task
+from scouthire_mas.agents.b_candidate_matcher import create_candidate_matcher_agent, create_matching_task, create_scoring_task, MatchResults
+from scouthire_mas.agents.c_aggregator import create_aggregator_agent, create_aggregation_task, assemble_report, AggregatedMatches, ScoutReport
+from scouthire_mas.llm_scheduler import Lane, scheduled_llm
+from scouthire_mas.metrics import SCOUTS, ScoutTimings
+from scouthire_mas.runtime import ScoutCancelled, check_cancelled, get_runtime
+from scouthire_mas.tools.job_compact import compact_jobs, dumps, rehydrate, token_savings
+from scouthire_mas.tools.match_cache import get_match_cache
+from scouthire_mas.tools.job_ranker import matched_terms
+from scouthire_mas.tools.job_filter import filter_jobs
+from scouthire_mas.tools.scrape_jobs_tool import fetch_jobs, select_jobs
 
+# "direct": scrape in Python, one structured matcher call, report assembled in Python.
+# "agents": the original three-agent crew (scraper -> matcher -> aggregator).
+PIPELINE_MODE = os.getenv("SCOUTHIRE_PIPELINE_MODE", "direct")
+# When enabled, the direct pipeline asks the LLM for a short summary instead of using the template.
+LLM_SUMMARY = os.getenv("SCOUTHIRE_LLM_SUMMARY", "0") == "1"
+# Profiles matched at the same time within one batch scout.
+BATCH_PARALLELISM = int(os.getenv("SCOUTHIRE_BATCH_PARALLELISM", "4"))
+# The matcher scores jobs in chunks of this size, several chunks at a time.
+MATCH_CHUNK_SIZE = int(os.getenv("SCOUTHIRE_MATCH_CHUNK_SIZE", "8"))
+MATCH_PARALLELISM = int(os.getenv("SCOUTHIRE_MATCH_PARALLELISM", "3"))
+# Extra attempts for a chunk whose call failed or returned invalid output.
+MATCH_RETRIES = int(os.getenv("SCOUTHIRE_MATCH_RETRIES", "1"))
+# Send a `timing` event with the per-stage breakdown before the result.
+TIMING_EVENTS = os.getenv("SCOUTHIRE_TIMING_EVENTS", "1") == "1"
 
-def run_scouthire_crew(query: str, location: str, candidate_profile: Any, step_callback: callable = None):
-    load_dotenv()
-    
-    # ---- LLM ----
-    llm = LLM(model="gemini/gemini-2.5-flash", temperature=0.1)
-    
-    # ---- Create Agents ----
-    job_scraper = create_job_scraper_agent(llm, step_callback)
-    candidate_matcher = create_candidate_matcher_agent(llm, step_callback)
-    aggregator = create_aggregator_agent(llm, step_callback)
-    
-    # ---- Create Tasks ----
-    job_task = create_job_task(job_scraper, query, location)
-    
-    # Format the candidate profile
-    profile_text = f"""
+
+def source_reporter(event_callback: Optional[Callable], timings: Optional[ScoutTimings] = None) -> Optional[Callable]:
+    """Turn per-source scrape results into `jobs_found` events, noting when each source arrived."""
+    if event_callback is None and timings is None:
+        return None
+
+    def report(name: str, jobs: List[Dict[str, Any]]) -> None:
+        if timings:
+            timings.source_done(name)
+        if event_callback:
+            event_callback({"type": "jobs_found", "source": name, "count": len(jobs)})
+    return report
+
+
+def report_scored_jobs(event_callback: Optional[Callable], jobs: List[Dict[str, Any]]) -> None:
+    """Send one `job_scored` event per scored job."""
+    if event_callback is None:
+        return
+    for job in jobs:
+        event_callback({"type": "job_scored", "content": job})
+
+
+def format_profile(candidate_profile: Any) -> str:
+    return f"""
     Candidate Profile:
     - **Experience**: {candidate_profile.experience}
     - **Skills**: {candidate_profile.skills}
     - **Goals**: {candidate_profile.goals}
 """
-    
-    matching_task = create_matching_task(candidate_matcher, profile_text)
+
+
+def local_matches(jobs: List[Dict[str, Any]], candidate_profile: Any) -> List[Dict[str, Any]]:
+    """Matches derived from local pre-ranking scores, used when the LLM is unavailable."""
+    matches = []
+    for job in jobs:
+        terms = matched_terms(job, candidate_profile)
+        matches.append({
+            "link": job.get("link"),
+            "match_score": job["local_score"],
+            "match_reason": f"Keyword match on: {', '.join(terms)}." if terms else "Keyword match with your profile.",
+        })
+    return matches
+
+
+def build_local_report(jobs: List[Dict[str, Any]], candidate_profile: Any, event_callback: Optional[Callable] = None) -> Dict[str, Any]:
+    """Build a ScoutReport from the local pre-ranking scores of `jobs`, for when the LLM is unavailable."""
+    summary = (
+        f"AI matching is currently unavailable, so these {len(jobs)} jobs were ranked locally "
+        "by keyword overlap with your skills, experience and goals."
+    )
+    report = assemble_report(jobs, local_matches(jobs, candidate_profile), summary=summary).model_dump()
+    report_scored_jobs(event_callback, report["jobs"])
+    return report
+
+
+def summarize_with_llm(llm: LLM, report: ScoutReport, query: str, location: str) -> Optional[str]:
+    """Optional one-paragraph summary of an assembled report. Returns None on failure."""
+    top = "\n".join(f"- {job.title} at {job.company} ({job.match_score}/100)" for job in report.jobs[:5])
+    prompt = (
+        f"Write a 2-sentence overview for a candidate of these job matches for '{query}' in '{location}'. "
+        f"{len(report.jobs)} matches in total. Top matches:\n{top}"
+    )
+    try:
+        return str(llm.call(prompt)).strip() or None
+    except Exception as e:
+        print(f"--- Summary LLM call failed, using template: {e} ---")
+        return None
+
+
+def _parse_match_results(result: Any, model: type = MatchResults) -> Optional[Any]:
+    if hasattr(result, 'pydantic') and isinstance(result.pydantic, model):
+        return result.pydantic
+    try:
+        raw_output = result.raw.strip()
+        if raw_output.startswith("```json"):
+            raw_output = raw_output[7:-3].strip()
+        return model.model_validate_json(raw_output)
+    except Exception:
+        return None
+
+
+def match_profile(
+    llm: LLM,
+    scraped_jobs: List[Dict[str, Any]],
+    query: str,
+    location: str,
+    candidate_profile: Any,
+    step_callback: callable = None,
+    cancel_event: Optional[threading.Event] = None,
+    event_callback: Optional[Callable] = None,
+    timings: Optional[ScoutTimings] = None,
+) -> Dict[str, Any]:
+    """Pre-rank already scraped jobs for one profile, score them with the matcher and assemble the report."""
+    timings = timings or ScoutTimings()
+    with timings.stage("prerank"):
+        jobs = select_jobs(scraped_jobs, candidate_profile)
+    check_cancelled(cancel_event)
+    if step_callback:
+        step_callback(f"Found {len(jobs)} relevant job postings. Scoring them against your profile...")
+    if not jobs:
+        return assemble_report([], [], query=query, location=location).model_dump()
+
+    # Only jobs never scored for this profile go to the LLM
+    match_cache = get_match_cache()
+    with timings.stage("match_cache"):
+        cached_matches, unscored = match_cache.lookup(candidate_profile, jobs)
+    report_scored_jobs(event_callback, assemble_report(jobs, cached_matches).model_dump()["jobs"])
+    if not unscored:
+        print(f"--- Match cache: all {len(jobs)} jobs already scored for this profile ---")
+        return finish_report(llm, jobs, cached_matches, query, location, timings)
+    print(f"--- Match cache: {len(jobs) - len(unscored)} cached, {len(unscored)} to score ---")
+
+    def on_chunk_scored(chunk: List[Dict[str, Any]], chunk_matches: List[Dict[str, Any]]) -> None:
+        match_cache.store(candidate_profile, chunk, chunk_matches)
+        report_scored_jobs(event_callback, assemble_report(chunk, chunk_matches).model_dump()["jobs"])
+
+    with timings.stage("scoring"):
+        new_matches, failed = score_jobs(llm, candidate_profile, unscored, step_callback, cancel_event, on_chunk_scored, timings)
+    if len(failed) == len(jobs):
+        print("--- Crew Error: every matcher chunk failed. Falling back to local pre-ranking scores ---")
+        return build_local_report(jobs, candidate_profile, event_callback)
+    if failed:
+        print(f"--- Crew Warning: {len(failed)} jobs could not be scored by the LLM. Using local scores for them ---")
+        fallback_matches = local_matches(failed, candidate_profile)
+        report_scored_jobs(event_callback, assemble_report(failed, fallback_matches).model_dump()["jobs"])
+        new_matches += fallback_matches
+    return finish_report(llm, jobs, cached_matches + new_matches, query, location, timings)
+
+
+def score_chunk(
+    llm: LLM,
+    profile_text: str,
+    chunk: List[Dict[str, Any]],
+    step_callback: callable = None,
+    timings: Optional[ScoutTimings] = None,
+) -> List[Dict[str, Any]]:
+    """Score one chunk of jobs with its own matcher crew. Raises if the output is not valid MatchResults.
+
+    The matcher sees compact jobs keyed j1, j2, ...; its matches are mapped back to links here.
+    """
+    compact, catalog = compact_jobs(chunk)
+    if timings:
+        timings.job_tokens(*token_savings(chunk, compact))
+    # A binding of its own, so the crew's token usage covers only this chunk
+    candidate_matcher = create_candidate_matcher_agent(scheduled_llm(llm, None), step_callback)
+    scoring_task = create_scoring_task(candidate_matcher, profile_text, dumps(compact))
+    crew = Crew(
+        agents=[candidate_matcher],
+        tasks=[scoring_task],
+        verbose=True,
+        share_crew=False,
+        step_callback=step_callback
+    )
+    started = time.perf_counter()
+    output = crew.kickoff()
+    if timings:
+        timings.agent_run(candidate_matcher.role, time.perf_counter() - started, task="scoring")
+        timings.llm_usage(candidate_matcher.role, output.token_usage)
+    results = _parse_match_results(output)
+    if results is None:
+        raise ValueError("Matcher output was not valid MatchResults")
+    return rehydrate([m.model_dump() for m in results.matches], catalog)
+
+
+def score_jobs(
+    llm: LLM,
+    candidate_profile: Any,
+    jobs: List[Dict[str, Any]],
+    step_callback: callable = None,
+    cancel_event: Optional[threading.Event] = None,
+    on_chunk_scored: Optional[Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], None]] = None,
+    timings: Optional[ScoutTimings] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Score jobs in fixed-size chunks with bounded parallelism, retrying failed chunks on their own.
+
+    Returns (matches, jobs whose chunk failed every attempt).
+    """
+    profile_text = format_profile(candidate_profile)
+    chunks = [jobs[i:i + MATCH_CHUNK_SIZE] for i in range(0, len(jobs), MATCH_CHUNK_SIZE)]
+
+    def score_with_retries(chunk: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        for attempt in range(1, MATCH_RETRIES + 2):
+            check_cancelled(cancel_event)
+            try:
+                return score_chunk(llm, profile_text, chunk, step_callback, timings)
+            except Exception as e:
+                # A cancelled step callback may surface wrapped by CrewAI; don't retry for it
+                check_cancelled(cancel_event)
+                print(f"--- Matcher chunk of {len(chunk)} jobs failed (attempt {attempt}): {e} ---")
+        return None
+
+    matches, failed = [], []
+    with ThreadPoolExecutor(max_workers=max(1, min(MATCH_PARALLELISM, len(chunks))), thread_name_prefix="match-chunk") as pool:
+        futures = {pool.submit(score_with_retries, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            chunk = futures[future]
+            chunk_matches = future.result()
+            if chunk_matches is None:
+                failed.extend(chunk)
+                continue
+            if on_chunk_scored:
+                on_chunk_scored(chunk, chunk_matches)
+            matches.extend(chunk_matches)
+    return matches, failed
+
+
+def finish_report(
+    llm: LLM,
+    jobs: List[Dict[str, Any]],
+    matches: List[Dict[str, Any]],
+    query: str,
+    location: str,
+    timings: Optional[ScoutTimings] = None,
+) -> Dict[str, Any]:
+    timings = timings or ScoutTimings()
+    with timings.stage("assemble"):
+        report = assemble_report(jobs, matches, query=query, location=location)
+    if LLM_SUMMARY and report.jobs:
+        with timings.stage("summary"):
+            report.summary = summarize_with_llm(llm, report, query, location) or report.summary
+    print(f"--- Crew Success: Assembled report with {len(report.jobs)} jobs ---")
+    return report.model_dump()
+
+
+def run_direct_pipeline(llm: LLM, query: str, location: str, candidate_profile: Any, step_callback: callable = None, cancel_event: Optional[threading.Event] = None, event_callback: Optional[Callable] = None, timings: Optional[ScoutTimings] = None, filters: Optional[Any] = None) -> Dict[str, Any]:
+    """Scrape, filter and pre-rank in Python, score with a single matcher call, assemble the report in Python."""
+    timings = timings or ScoutTimings()
+    with timings.stage("scrape"):
+        scraped_jobs = fetch_jobs(query, location, source_reporter(event_callback, timings))
+    with timings.stage("filter"):
+        scraped_jobs = filter_jobs(scraped_jobs, location, filters)
+    return match_profile(llm, scraped_jobs, query, location, candidate_profile, step_callback, cancel_event, event_callback, timings)
+
+
+def task_timer(timings: ScoutTimings) -> Callable:
+    """Crew task_callback recording each sequential task's duration against its agent."""
+    last_done = [time.perf_counter()]
+
+    def on_task_done(output: Any) -> None:
+        now = time.perf_counter()
+        agent = str(getattr(output, "agent", "") or "unknown")
+        timings.agent_run(agent, now - last_done[0], task=getattr(output, "name", None) or agent)
+        last_done[0] = now
+    return on_task_done
+
+
+def run_agent_pipeline(llm: LLM, query: str, location: str, candidate_profile: Any, step_callback: callable = None, cancel_event: Optional[threading.Event] = None, event_callback: Optional[Callable] = None, timings: Optional[ScoutTimings] = None, filters: Optional[Any] = None) -> Dict[str, Any]:
+    """The original sequential three-agent crew. Agents pass compact jobs by id; the report is rehydrated from `catalog`."""
+    timings = timings or ScoutTimings()
+    catalog: Dict[str, Dict[str, Any]] = {}
+    # ---- Create Agents ----
+    # The crew sums token usage over its agents' LLMs, so each agent gets its own binding
+    job_scraper = create_job_scraper_agent(scheduled_llm(llm, None), step_callback, candidate_profile, source_reporter(event_callback, timings), catalog.update, filters)
+    candidate_matcher = create_candidate_matcher_agent(scheduled_llm(llm, None), step_callback)
+    aggregator = create_aggregator_agent(scheduled_llm(llm, None), step_callback)
+
+    # ---- Create Tasks ----
+    job_task = create_job_task(job_scraper, query, location)
+    matching_task = create_matching_task(candidate_matcher, format_profile(candidate_profile))
     aggregation_task = create_aggregation_task(aggregator)
-    
+
     # ---- Crew ----
     crew = Crew(
         agents=[job_scraper, candidate_matcher, aggregator],
         tasks=[job_task, matching_task, aggregation_task],
         verbose=True,
-        max_rpm=10,
         share_crew=False,
-        step_callback=step_callback
+        step_callback=step_callback,
+        task_callback=task_timer(timings),
     )
 
-    result = crew.kickoff()
-    
-    # Return structured data
-    if hasattr(result, 'pydantic') and result.pydantic:
-        print(f"--- Crew Success: Returning structured JSON report ---")
-        return result.pydantic.model_dump()
-    
-    # Attempt manual parse if Pydantic failed but output might be JSON string
+    check_cancelled(cancel_event)
     try:
-        import json
-        raw_output = result.raw
-        # Strip potential markdown code blocks
-        if raw_output.startswith("```json"):
-            raw_output = raw_output[7:-3].strip()
-        parsed = json.loads(raw_output)
-        print(f"--- Crew Warning: Manual JSON parse successful ---")
-        return parsed
-    except:
+        with timings.stage("crew"):
+            result = crew.kickoff()
+        timings.llm_usage("crew", result.token_usage)
+    except Exception as e:
+        # A cancelled step callback may surface wrapped by CrewAI; don't fall back for it
+        check_cancelled(cancel_event)
+        print(f"--- Crew Error: {e}. Falling back to local pre-ranking scores ---")
+        jobs = filter_jobs(fetch_jobs(query, location), location, filters)
+        return build_local_report(select_jobs(jobs, candidate_profile), candidate_profile, event_callback)
+
+    aggregated = _parse_match_results(result, AggregatedMatches)
+    if aggregated is None:
         print(f"--- Crew Error: All structured parsing failed. Returning empty schema. ---")
         return {"summary": "Report generation failed. Please try again.", "jobs": []}
+
+    # ---- Rehydrate the agents' id-keyed matches into the full report ----
+    jobs = list(catalog.values())
+    timings.job_tokens(*token_savings(jobs, compact_jobs(jobs)[0]))
+    matches = rehydrate([m.model_dump() for m in aggregated.matches], catalog)
+    report = assemble_report(jobs, matches, query=query, location=location)
+    report.summary = aggregated.summary or report.summary
+    print(f"--- Crew Success: Returning structured JSON report ---")
+    report = report.model_dump()
+    report_scored_jobs(event_callback, report["jobs"])
+    return report
+
+
+def run_scouthire_crew(
+    query: str,
+    location: str,
+    candidate_profile: Any,
+    step_callback: callable = None,
+    mode: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None,
+    event_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    llm: Optional[LLM] = None,
+    filters: Optional[Any] = None,
+):
+    """Run one scout. `event_callback` receives `jobs_found` events per job board and `job_scored` per match.
+
+    `filters` (min_salary, max_age_days, seniority, employment_types, remote_only) drop jobs before matching.
+    """
+    # ---- LLM: shared by every scout in this process, paced by the worker-wide scheduler ----
+    llm = scheduled_llm(llm or get_runtime().llm, Lane("interactive", event_callback=event_callback, cancel_event=cancel_event))
+    pipeline = "agents" if (mode or PIPELINE_MODE) == "agents" else "direct"
+    run_pipeline = run_agent_pipeline if pipeline == "agents" else run_direct_pipeline
+
+    timings = ScoutTimings()
+    try:
+        report = run_pipeline(llm, query, location, candidate_profile, step_callback, cancel_event, event_callback, timings, filters)
+    except ScoutCancelled:
+        SCOUTS.inc(pipeline=pipeline, outcome="cancelled")
+        raise
+    except Exception:
+        SCOUTS.inc(pipeline=pipeline, outcome="error")
+        raise
+    SCOUTS.inc(pipeline=pipeline, outcome="ok")
+    emit_timing(event_callback, timings)
+    return report
+
+
+def emit_timing(event_callback: Optional[Callable], timings: ScoutTimings) -> None:
+    summary = timings.summary()
+    print(f"--- Scout timing: {summary['total_ms']} ms, stages {summary['stages_ms']} ---")
+    job_list = summary["job_list_tokens"]
+    if job_list["verbose"]:
+        print(f"--- Job lists sent to agents: ~{job_list['compact']} tokens instead of ~{job_list['verbose']} (saved {job_list['saved']}) ---")
+    if TIMING_EVENTS and event_callback:
+        event_callback({"type": "timing", "content": summary})
+
+
+def run_scouthire_batch(
+    query: str,
+    location: str,
+    profiles: List[Tuple[str, Any]],
+    step_callback: callable = None,
+    cancel_event: Optional[threading.Event] = None,
+    event_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    max_parallel: int = BATCH_PARALLELISM,
+    llm: Optional[LLM] = None,
+    filters: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Scrape once and match every (profile_id, CandidateProfile) against the shared job set in parallel.
+
+    Per-profile events (`step`, `job_scored`) carry a `profile_id`, and each finished profile
+    is reported as a `profile_result` (or `profile_error`) event as soon as it completes.
+    """
+    llm = scheduled_llm(llm or get_runtime().llm, Lane("batch", event_callback=event_callback, cancel_event=cancel_event))
+
+    timings = ScoutTimings()
+    with timings.stage("scrape"):
+        scraped_jobs = fetch_jobs(query, location, source_reporter(event_callback, timings))
+    with timings.stage("filter"):
+        scraped_jobs = filter_jobs(scraped_jobs, location, filters)
+    check_cancelled(cancel_event)
+
+    def match_one(profile_id: str, profile: Any) -> Dict[str, Any]:
+        def on_step(step):
+            if step_callback:
+                step_callback(f"[{profile_id}] {step}" if isinstance(step, str) else step)
+
+        def on_event(event: Dict[str, Any]) -> None:
+            if event_callback:
+                event_callback({**event, "profile_id": profile_id})
+
+        return match_profile(llm, scraped_jobs, query, location, profile, on_step, cancel_event, on_event, timings)
+
+    completed, failed = 0, 0
+    with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="batch-match") as pool:
+        futures = {pool.submit(match_one, profile_id, profile): profile_id for profile_id, profile in profiles}
+        try:
+            for future in as_completed(futures):
+                profile_id = futures[future]
+                try:
+                    report = future.result()
+                except ScoutCancelled:
+                    raise
+                except Exception as e:
+                    failed += 1
+                    if event_callback:
+                        event_callback({"type": "profile_error", "profile_id": profile_id, "content": str(e)})
+                    continue
+                completed += 1
+                if event_callback:
+                    event_callback({"type": "profile_result", "profile_id": profile_id, "content": report})
+        except ScoutCancelled:
+            for future in futures:
+                future.cancel()
+            SCOUTS.inc(pipeline="batch", outcome="cancelled")
+            raise
+
+    SCOUTS.inc(pipeline="batch", outcome="ok" if not failed else "partial")
+    emit_timing(event_callback, timings)
+    return {"query": query, "location": location, "profiles": len(profiles), "completed": completed, "failed": failed}
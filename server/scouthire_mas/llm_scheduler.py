@@ -0,0 +1,363 @@
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Optional
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from pydantic import PrivateAttr
+
+from scouthire_mas.metrics import Metric
+from scouthire_mas.runtime import ScoutCancelled
+
+# Every LLM call in this worker goes through one scheduler, so concurrent crews share the provider
+# quota instead of each pacing itself. Set these to the project's quota; with several uvicorn
+# workers, SCOUTHIRE_LLM_WORKERS splits it evenly between them.
+LLM_RPM = float(os.getenv("SCOUTHIRE_LLM_RPM", "60"))
+LLM_TPM = float(os.getenv("SCOUTHIRE_LLM_TPM", "1000000"))
+LLM_WORKERS = max(1, int(os.getenv("SCOUTHIRE_LLM_WORKERS", "1")))
+# Attempts at one call that the provider rejected with 429, waiting out its retry delay each time.
+LLM_RATE_LIMIT_RETRIES = int(os.getenv("SCOUTHIRE_LLM_429_RETRIES", "3"))
+# Pause used when a 429 carries no retry delay.
+DEFAULT_RETRY_AFTER = 10.0
+# Calls expected to wait at least this long are announced to the client as `llm_queued` events.
+WAIT_EVENT_MIN_SECONDS = 1.0
+# Interactive calls served in a row before a waiting batch call gets a turn.
+INTERACTIVE_BURST = 4
+
+PRIORITIES = ("interactive", "batch")
+
+RETRY_DELAY_PATTERN = re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s")
+
+
+class TokenBucket:
+    """Refills continuously at `rate` per second up to `capacity`. Balance may go negative (debt)."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until `amount` (capped at capacity) is available."""
+        needed = min(amount, self.capacity) - self.level
+        return max(0.0, needed / self.rate) if self.rate > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+
+class Lane:
+    """One scout's place in the scheduler: calls with the same key are queued fairly against other keys."""
+
+    def __init__(
+        self,
+        priority: str = "interactive",
+        key: Optional[str] = None,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        self.priority = priority if priority in PRIORITIES else "interactive"
+        self.key = key or uuid.uuid4().hex
+        self.event_callback = event_callback
+        self.cancel_event = cancel_event
+
+
+class _Waiter:
+    __slots__ = ("lane", "tokens", "enqueued")
+
+    def __init__(self, lane: Lane, tokens: float):
+        self.lane = lane
+        self.tokens = tokens
+        self.enqueued = time.monotonic()
+
+
+class LLMScheduler:
+    """Token-bucket admission for LLM calls with an RPM and a TPM budget.
+
+    Waiting calls are served interactive-first, round-robin across lanes within a priority,
+    so one scout with many chunks cannot starve the others. The request bucket holds a single
+    request, which paces calls evenly at the quota rather than bursting and then stalling.
+    A 429 pauses every lane until the provider's retry delay has passed.
+    """
+
+    def __init__(self, rpm: float = LLM_RPM / LLM_WORKERS, tpm: float = LLM_TPM / LLM_WORKERS):
+        self.requests = TokenBucket(rpm / 60.0, 1.0)
+        # Ten seconds' worth of tokens, so large prompts can go out without waiting for a full bucket
+        self.tokens = TokenBucket(tpm / 60.0, max(1.0, tpm / 6.0))
+        self.paused_until = 0.0
+        self.throttled = 0
+        self._queues: Dict[str, "OrderedDict[str, deque]"] = {p: OrderedDict() for p in PRIORITIES}
+        self._interactive_streak = 0
+        self._cond = threading.Condition()
+
+    # ---- Queue bookkeeping (caller holds the lock) ----
+    def _waiting(self, priority: Optional[str] = None) -> int:
+        priorities = [priority] if priority else PRIORITIES
+        return sum(len(q) for p in priorities for q in self._queues[p].values())
+
+    def _next_priority(self) -> Optional[str]:
+        interactive, batch = self._queues["interactive"], self._queues["batch"]
+        if interactive and (not batch or self._interactive_streak < INTERACTIVE_BURST):
+            return "interactive"
+        return "batch" if batch else None
+
+    def _head(self) -> Optional[_Waiter]:
+        priority = self._next_priority()
+        if priority is None:
+            return None
+        return next(iter(self._queues[priority].values()))[0]
+
+    def _remove(self, waiter: _Waiter) -> None:
+        lanes = self._queues[waiter.lane.priority]
+        queue = lanes.get(waiter.lane.key)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if queue:
+            # Served lanes go to the back of the rotation
+            lanes.move_to_end(waiter.lane.key)
+        else:
+            del lanes[waiter.lane.key]
+
+    def _ready_in(self, waiter: _Waiter, now: float) -> float:
+        self.requests.refill(now)
+        self.tokens.refill(now)
+        return max(self.paused_until - now, self.requests.wait_for(1.0), self.tokens.wait_for(waiter.tokens))
+
+    def _estimate(self, waiter: _Waiter, now: float) -> float:
+        """Rough wait: the calls and tokens ahead of `waiter`, drained at the configured rates."""
+        ahead = [
+            w for p in PRIORITIES for q in self._queues[p].values() for w in q
+            if w is not waiter and (PRIORITIES.index(p) < PRIORITIES.index(waiter.lane.priority)
+                                    or (p == waiter.lane.priority and w.enqueued <= waiter.enqueued))
+        ]
+        by_requests = (len(ahead) + 1 - self.requests.level) / self.requests.rate if self.requests.rate > 0 else 0.0
+        tokens_ahead = sum(w.tokens for w in ahead) + waiter.tokens
+        by_tokens = (tokens_ahead - self.tokens.level) / self.tokens.rate if self.tokens.rate > 0 else 0.0
+        return max(0.0, self.paused_until - now, by_requests, by_tokens)
+
+    # ---- Public API ----
+    def acquire(self, lane: Lane, tokens: float) -> float:
+        """Block until a call estimated at `tokens` may be sent for `lane`. Returns seconds waited."""
+        waiter = _Waiter(lane, tokens)
+        announced = None
+        with self._cond:
+            self._queues[lane.priority].setdefault(lane.key, deque()).append(waiter)
+            try:
+                while True:
+                    if lane.cancel_event is not None and lane.cancel_event.is_set():
+                        raise ScoutCancelled()
+                    now = time.monotonic()
+                    head = self._head()
+                    delay = self._ready_in(waiter, now) if head is waiter else None
+                    if delay == 0.0:
+                        break
+                    estimate = self._estimate(waiter, now)
+                    if estimate >= WAIT_EVENT_MIN_SECONDS and (announced is None or abs(estimate - announced) >= 5.0):
+                        announced = estimate
+                        self._announce(lane, estimate)
+                    # Non-head waiters are woken when the head leaves; the timeout also covers cancellation
+                    self._cond.wait(timeout=min(delay if delay is not None else 1.0, 1.0))
+            except BaseException:
+                self._remove(waiter)
+                self._cond.notify_all()
+                raise
+            self._remove(waiter)
+            self.requests.take(1.0)
+            self.tokens.take(tokens)
+            if lane.priority == "interactive" and self._queues["batch"]:
+                self._interactive_streak += 1
+            else:
+                self._interactive_streak = 0
+            self._cond.notify_all()
+        waited = time.monotonic() - waiter.enqueued
+        LLM_QUEUE_WAIT_SECONDS.observe(waited, priority=lane.priority)
+        return waited
+
+    def settle(self, estimated: float, actual: float) -> None:
+        """Charge the token bucket for the difference between a call's estimate and its real usage."""
+        if actual <= 0:
+            return
+        with self._cond:
+            self.tokens.take(actual - estimated)
+
+    def pause(self, seconds: float, lane: Optional[Lane] = None) -> None:
+        """The provider answered 429: hold every lane for `seconds`."""
+        with self._cond:
+            self.throttled += 1
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.requests.level = min(self.requests.level, 0.0)
+            self._cond.notify_all()
+        LLM_THROTTLED.inc()
+        print(f"--- LLM rate limited by provider, pausing all calls for {seconds:.1f}s ---")
+        if lane is not None:
+            self._announce(lane, seconds)
+
+    @staticmethod
+    def _announce(lane: Lane, seconds: float) -> None:
+        if lane.event_callback:
+            lane.event_callback({"type": "llm_queued", "priority": lane.priority, "wait_seconds": round(seconds, 1)})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "rpm": round(self.requests.rate * 60, 1),
+                "tpm": round(self.tokens.rate * 60, 1),
+                "waiting": {p: self._waiting(p) for p in PRIORITIES},
+                "paused_for": round(max(0.0, self.paused_until - time.monotonic()), 1),
+                "throttled": self.throttled,
+            }
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
+
+
+# ---- 429 detection ----
+def rate_limit_delay(error: Exception) -> Optional[float]:
+    """Seconds to wait if `error` is a provider 429, from Retry-After or Gemini's RetryInfo; else None."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    text = str(error)
+    if code != 429 and "429" not in text and "RESOURCE_EXHAUSTED" not in text:
+        return None
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        pass
+    match = RETRY_DELAY_PATTERN.search(text)
+    return float(match.group(1)) if match else DEFAULT_RETRY_AFTER
+
+
+def estimate_tokens(messages: Any) -> int:
+    """About four characters per token, plus room for the answer."""
+    text = messages if isinstance(messages, str) else " ".join(str(m.get("content", "")) for m in messages)
+    return len(text) // 4 + 256
+
+
+# ---- Provider usage capture ----
+_call_usage = threading.local()
+
+
+def _capture_usage(llm: BaseLLM) -> None:
+    """Copy the usage an LLM records for a call into the calling thread, so a shared client's
+    lifetime counters are not needed to attribute tokens to a scout."""
+    if getattr(llm, "_scouthire_captured", False):
+        return
+    track = llm._track_token_usage_internal
+
+    def tracked(usage_data: Dict[str, Any]) -> None:
+        track(usage_data)
+        sink = getattr(_call_usage, "sink", None)
+        if sink is not None:
+            sink.append(usage_data)
+
+    object.__setattr__(llm, "_track_token_usage_internal", tracked)
+    object.__setattr__(llm, "_scouthire_captured", True)
+
+
+class ScheduledLLM(BaseLLM):
+    """Sends a shared LLM's calls through the scheduler on behalf of one lane.
+
+    Cheap to build; a fresh one per crew gives that crew exact `token_usage`.
+    """
+
+    _inner: Any = PrivateAttr(default=None)
+    _lane: Any = PrivateAttr(default=None)
+
+    @classmethod
+    def wrap(cls, llm: Any, lane: Lane) -> "ScheduledLLM":
+        inner = llm._inner if isinstance(llm, ScheduledLLM) else llm
+        _capture_usage(inner)
+        scheduled = cls(model=inner.model, temperature=getattr(inner, "temperature", None), stop=list(inner.stop))
+        scheduled._inner = inner
+        scheduled._lane = lane
+        return scheduled
+
+    def fork(self) -> "ScheduledLLM":
+        return ScheduledLLM.wrap(self._inner, self._lane)
+
+    def supports_function_calling(self) -> bool:
+        return self._inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self._inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self._inner.get_context_window_size()
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        scheduler = get_llm_scheduler()
+        estimate = estimate_tokens(messages)
+        for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+            scheduler.acquire(self._lane, estimate)
+            _call_usage.sink = []
+            try:
+                # Agents set their stop words on the LLM they hold; pass them on to the shared client
+                with call_stop_override(self._inner, list(self.stop_sequences) or None):
+                    answer = self._inner.call(
+                        messages,
+                        tools=tools,
+                        callbacks=callbacks,
+                        available_functions=available_functions,
+                        from_task=from_task,
+                        from_agent=from_agent,
+                        response_model=response_model,
+                    )
+            except Exception as e:
+                delay = rate_limit_delay(e)
+                if delay is None or attempt == LLM_RATE_LIMIT_RETRIES:
+                    raise
+                scheduler.pause(delay, self._lane)
+                continue
+            finally:
+                usage, _call_usage.sink = _call_usage.sink, None
+            for usage_data in usage:
+                self._track_token_usage_internal(usage_data)
+            scheduler.settle(estimate, sum(int(u.get("total_tokens") or 0) for u in usage))
+            return answer
+
+
+def scheduled_llm(llm: Any, lane: Optional[Lane]) -> Any:
+    """`llm` bound to `lane`, or a fresh binding of an already scheduled LLM (for per-crew usage)."""
+    if lane is not None:
+        return ScheduledLLM.wrap(llm, lane)
+    if isinstance(llm, ScheduledLLM):
+        return llm.fork()
+    return llm
+
+
+# ---- Metrics ----
+LLM_QUEUE_WAIT_SECONDS = Metric(
+    "scouthire_llm_queue_wait_seconds", "histogram", "Time an LLM call waited for the rate limiter.", ("priority",)
+)
+LLM_THROTTLED = Metric("scouthire_llm_throttled_total", "counter", "LLM calls the provider rejected with 429.")
+LLM_WAITING = Metric(
+    "scouthire_llm_waiting", "gauge", "LLM calls waiting for the rate limiter.", ("priority",),
+    collect=lambda: {(p,): n for p, n in get_llm_scheduler().stats()["waiting"].items()},
+)
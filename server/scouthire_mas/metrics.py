@@ -0,0 +1,239 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Instrumentation for the scout pipeline, rendered in the Prometheus text format at /metrics.
+# Kept dependency-free (and free of crewai imports) so any module can record into it cheaply.
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """A labelled counter, gauge or histogram.
+
+    `collect`, when given, is called at render time and returns {label values: value};
+    use it for values another component already keeps (cache counters, queue depth).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.collect = collect
+        self._values: Dict[LabelValues, float] = {}
+        self._histograms: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # Per label set: one count per bucket, then +Inf count, then sum
+            state = self._histograms.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += 1
+            state[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        if self.kind == "histogram":
+            with self._lock:
+                histograms = {key: list(state) for key, state in self._histograms.items()}
+            for key, state in sorted(histograms.items()):
+                for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                    le = 'le="' + _format_value(bound) + '"'
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(count)}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-1])}")
+            return lines
+        if self.collect is not None:
+            try:
+                values = self.collect()
+            except Exception as e:
+                print(f"Error collecting metric {self.name}: {e}")
+                values = {}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        for key, value in sorted(values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+REGISTRY: List[Metric] = []
+
+
+def render_metrics() -> str:
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+# ---- Pipeline metrics ----
+SOURCE_FETCH_SECONDS = Metric(
+    "scouthire_source_fetch_seconds", "histogram", "Time to fetch and parse one job board.", ("source",)
+)
+SOURCE_FETCHES = Metric(
+    "scouthire_source_fetches_total", "counter",
+    "Job board fetches by outcome (HTTP status, error or late).", ("source", "status"),
+)
+SOURCE_JOBS = Metric("scouthire_source_jobs_total", "counter", "Postings returned per job board.", ("source",))
+JOBS_FILTERED = Metric("scouthire_jobs_filtered_total", "counter", "Postings dropped before matching, by filter rule.", ("rule",))
+STAGE_SECONDS = Metric("scouthire_stage_seconds", "histogram", "Time spent per pipeline stage.", ("stage",))
+AGENT_SECONDS = Metric("scouthire_agent_seconds", "histogram", "Time per agent run.", ("agent",))
+TASK_SECONDS = Metric("scouthire_task_seconds", "histogram", "Time per crew task.", ("task",))
+LLM_TOKENS = Metric("scouthire_llm_tokens_total", "counter", "LLM tokens used.", ("agent", "kind"))
+LLM_REQUESTS = Metric("scouthire_llm_requests_total", "counter", "Successful LLM requests.", ("agent",))
+JOB_PROMPT_TOKENS = Metric(
+    "scouthire_job_prompt_tokens_total", "counter",
+    "Estimated prompt tokens of job lists sent to agents, and what the full job dicts would have cost.", ("encoding",),
+)
+SCOUTS = Metric("scouthire_scouts_total", "counter", "Finished scouts by pipeline and outcome.", ("pipeline", "outcome"))
+
+
+def _cache_lookups() -> Dict[LabelValues, float]:
+    from scouthire_mas.tools.job_cache import get_job_cache
+    from scouthire_mas.tools.match_cache import get_match_cache
+    jobs, matches = get_job_cache(), get_match_cache()
+    return {
+        ("jobs", "hit"): jobs.hits,
+        ("jobs", "stale"): jobs.stale_hits,
+        ("jobs", "miss"): jobs.misses,
+        ("jobs", "coalesced"): jobs.coalesced,
+        ("match_scores", "hit"): matches.hits,
+        ("match_scores", "miss"): matches.misses,
+    }
+
+
+CACHE_LOOKUPS = Metric(
+    "scouthire_cache_lookups_total", "counter", "Cache lookups by cache and result.", ("cache", "result"),
+    collect=_cache_lookups,
+)
+
+
+class ScoutTimings:
+    """Per-scout breakdown, recorded into the process-wide metrics as it goes.
+
+    A stage's time is wall-clock: while several profiles of a batch are in the same stage,
+    it counts once. The stage histogram still gets one observation per run of the stage.
+    Agent times are summed over calls, so parallel calls can exceed wall time.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        # Runs of each stage in progress, and since when at least one has been
+        self._active: Dict[str, int] = {}
+        self._active_since: Dict[str, float] = {}
+        self.sources: Dict[str, float] = {}
+        self.agents: Dict[str, float] = {}
+        self.tokens = {"prompt": 0, "completion": 0}
+        self.job_list_tokens = {"verbose": 0, "compact": 0}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        with self._lock:
+            if not self._active.get(name):
+                self._active_since[name] = started
+            self._active[name] = self._active.get(name, 0) + 1
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            STAGE_SECONDS.observe(ended - started, stage=name)
+            with self._lock:
+                self._active[name] -= 1
+                if not self._active[name]:
+                    self.stages[name] = self.stages.get(name, 0.0) + ended - self._active_since.pop(name)
+
+    def source_done(self, name: str) -> None:
+        """Note when a job board's results reached this scout, relative to its start."""
+        with self._lock:
+            self.sources[name] = time.perf_counter() - self.started
+
+    def agent_run(self, agent: str, seconds: float, task: Optional[str] = None) -> None:
+        AGENT_SECONDS.observe(seconds, agent=agent)
+        if task:
+            TASK_SECONDS.observe(seconds, task=task)
+        with self._lock:
+            self.agents[agent] = self.agents.get(agent, 0.0) + seconds
+
+    def llm_usage(self, agent: str, usage: Any) -> None:
+        """Record a crew's UsageMetrics (or anything with prompt/completion token counts)."""
+        prompt = int(getattr(usage, "prompt_tokens", 0) or 0)
+        completion = int(getattr(usage, "completion_tokens", 0) or 0)
+        LLM_TOKENS.inc(prompt, agent=agent, kind="prompt")
+        LLM_TOKENS.inc(completion, agent=agent, kind="completion")
+        LLM_REQUESTS.inc(int(getattr(usage, "successful_requests", 0) or 0), agent=agent)
+        with self._lock:
+            self.tokens["prompt"] += prompt
+            self.tokens["completion"] += completion
+
+    def job_tokens(self, verbose: int, compact: int) -> None:
+        """Estimated tokens of a job list as full dicts and as the compact form agents actually got."""
+        JOB_PROMPT_TOKENS.inc(verbose, encoding="verbose")
+        JOB_PROMPT_TOKENS.inc(compact, encoding="compact")
+        with self._lock:
+            self.job_list_tokens["verbose"] += verbose
+            self.job_list_tokens["compact"] += compact
+
+    def summary(self) -> Dict[str, Any]:
+        def ms(values: Dict[str, float]) -> Dict[str, float]:
+            return {name: round(seconds * 1000, 1) for name, seconds in values.items()}
+
+        with self._lock:
+            return {
+                "total_ms": round((time.perf_counter() - self.started) * 1000, 1),
+                "stages_ms": ms(self.stages),
+                "sources_ms": ms(self.sources),
+                "agents_ms": ms(self.agents),
+                "tokens": dict(self.tokens),
+                "job_list_tokens": {
+                    **self.job_list_tokens,
+                    "saved": self.job_list_tokens["verbose"] - self.job_list_tokens["compact"],
+                },
+            }
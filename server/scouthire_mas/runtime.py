@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+# Kept free of crewai imports so the API can import it without paying CrewAI's ~4s import cost.
+# .env is read once per process, before the settings below.
+load_dotenv()
+
+LLM_MODEL = os.getenv("SCOUTHIRE_LLM_MODEL", "gemini/gemini-2.5-flash")
+LLM_TEMPERATURE = float(os.getenv("SCOUTHIRE_LLM_TEMPERATURE", "0.1"))
+# Whether this worker runs the background ingestion into the job index (index scrape mode only).
+INGEST_WORKER = os.getenv("SCOUTHIRE_INGEST_WORKER", "1") == "1"
+
+
+class ScoutCancelled(Exception):
+    """Raised inside a run when its client has gone away, to stop spending LLM calls on it."""
+
+
+def check_cancelled(cancel_event: Optional[threading.Event]) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise ScoutCancelled()
+
+
+class ScoutRuntime:
+    """Process-level state shared by every scout in this worker: environment, LLM client and imports.
+
+    Built once per worker (FastAPI lifespan). Requests only create their own tasks, crews and
+    callbacks. Agents are not shared because CrewAI binds an executor to an agent on kickoff,
+    so one agent cannot serve two crews at the same time; they cost well under a millisecond.
+    """
+
+    def __init__(self):
+        # Crew telemetry spans are exported over the network on every kickoff
+        os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+        self._llm = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self.warmup_seconds: Optional[float] = None
+
+    @property
+    def llm(self):
+        """The shared LLM client. The first call imports the provider SDK (~2s); later calls are free."""
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    from crewai import LLM
+                    self._llm = LLM(model=LLM_MODEL, temperature=LLM_TEMPERATURE)
+        return self._llm
+
+    def set_llm(self, llm: Any) -> None:
+        """Use `llm` for every scout in this worker instead of the configured model (benchmarks)."""
+        with self._lock:
+            self._llm = llm
+
+    def warm_up(self) -> None:
+        """Import the crew modules and build the LLM client ahead of the first request."""
+        started = time.perf_counter()
+        try:
+            import scouthire_mas.crew  # noqa: F401
+            self.llm
+            self.warmup_seconds = time.perf_counter() - started
+            print(f"--- Runtime warm-up finished in {self.warmup_seconds:.2f}s ---")
+        except Exception as e:
+            print(f"Error warming up runtime: {e}")
+        finally:
+            self._ready.set()
+
+    def warm_up_in_background(self) -> None:
+        """Warm up on a daemon thread so the worker starts accepting connections immediately."""
+        threading.Thread(target=self.warm_up, name="runtime-warmup", daemon=True).start()
+
+    def start_ingestion(self) -> bool:
+        """Keep the job index fresh from a daemon thread when scouts are answered from it."""
+        from scouthire_mas.tools.job_index import SCRAPE_MODE
+        if SCRAPE_MODE != "index" or not INGEST_WORKER:
+            return False
+
+        def run() -> None:
+            from scouthire_mas.tools.job_ingest import run_ingest_worker
+            run_ingest_worker(self._stop)
+
+        threading.Thread(target=run, name="job-ingest", daemon=True).start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def run_scout(self, **kwargs: Any) -> Dict[str, Any]:
+        from scouthire_mas.crew import run_scouthire_crew
+        return run_scouthire_crew(llm=self.llm, **kwargs)
+
+    def run_batch(self, **kwargs: Any) -> Dict[str, Any]:
+        from scouthire_mas.crew import run_scouthire_batch
+        return run_scouthire_batch(llm=self.llm, **kwargs)
+
+
+_runtime: Optional[ScoutRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> ScoutRuntime:
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = ScoutRuntime()
+        return _runtime
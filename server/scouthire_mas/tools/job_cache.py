@@ -0,0 +1,267 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def normalize_key(query: str, location: Optional[str]) -> str:
+    """Build a cache key so 'Python  Dev' / 'python dev' and 'remote' / 'Remote ' share an entry."""
+    norm_query = " ".join((query or "").lower().split())
+    norm_location = " ".join((location or "remote").lower().split())
+    return f"{norm_query}|{norm_location}"
+
+
+class MemoryCacheBackend:
+    """In-process LRU store. Each uvicorn worker keeps its own copy."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            value, stored_at = entry
+        return copy.deepcopy(value), stored_at
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many([(key, value)])
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[Any, float]]:
+        entries = {}
+        for key in keys:
+            entry = self.get(key)
+            if entry is not None:
+                entries[key] = entry
+        return entries
+
+    def set_many(self, items: List[Tuple[str, Any]]) -> None:
+        now = time.time()
+        with self._lock:
+            for key, value in items:
+                self._data[key] = (copy.deepcopy(value), now)
+                self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SQLiteCacheBackend:
+    """SQLite store shared by every worker pointing at the same file. Values must be JSON-serializable."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 256, table: str = "job_cache"):
+        self.path = path
+        self.max_entries = max_entries
+        self.table = table
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_accessed ON {self.table} (accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT value, stored_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many([(key, value)])
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[Any, float]]:
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT key, value, stored_at FROM {self.table} WHERE key IN ({placeholders})", keys
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE {self.table} SET accessed_at = ? WHERE key IN ({placeholders})", [time.time(), *keys]
+                )
+        return {key: (json.loads(value), stored_at) for key, value, stored_at in rows}
+
+    def set_many(self, items: List[Tuple[str, Any]]) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(value), now, now) for key, value in items],
+            )
+            # LRU eviction: drop the least recently read rows above the bound
+            excess = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)",
+                    (excess,),
+                )
+
+    def size(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class _Load:
+    """A fetch in progress for one key, awaited by every caller that missed on it meanwhile."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class JobCache:
+    """TTL cache with stale-while-revalidate on top of a pluggable backend.
+
+    Entries younger than `ttl` are fresh. Entries younger than `ttl + stale_ttl` are
+    still served, but trigger a single background refresh for that key. Concurrent misses
+    on one key share a single fetch.
+    """
+
+    def __init__(self, backend, ttl: float = 600, stale_ttl: float = 1800):
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.coalesced = 0
+        self._refreshing = set()
+        self._loading: Dict[str, _Load] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: str, loader: Callable[[], Any]) -> Any:
+        entry = self.backend.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self._count("hits")
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(key, loader)
+                return value
+
+        return self._load_once(key, loader)
+
+    def _load_once(self, key: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            load = self._loading.get(key)
+            leader = load is None
+            if leader:
+                load = self._loading[key] = _Load()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            load.done.wait()
+            if load.error is not None:
+                raise load.error
+            return copy.deepcopy(load.value)
+
+        try:
+            load.value = loader()
+            self._store(key, load.value)
+            return load.value
+        except BaseException as e:
+            load.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._loading[key]
+            load.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "size": self.backend.size(),
+            "max_entries": self.backend.max_entries,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "coalesced": self.coalesced,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+    def _store(self, key: str, value: Any) -> None:
+        # An empty scrape usually means every board failed; don't pin that for a whole TTL.
+        if value:
+            self.backend.set(key, value)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self.refreshes += 1
+
+        def refresh():
+            try:
+                self._store(key, loader())
+            except Exception as e:
+                print(f"Error refreshing job cache entry '{key}': {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"cache-refresh:{key}", daemon=True).start()
+
+
+_job_cache: Optional[JobCache] = None
+_job_cache_lock = threading.Lock()
+
+
+def get_job_cache() -> JobCache:
+    """Process-wide job cache, configured from the environment on first use.
+
+    SCOUTHIRE_JOB_CACHE_DB selects the shared SQLite backend; otherwise an in-memory LRU is used.
+    """
+    global _job_cache
+    with _job_cache_lock:
+        if _job_cache is None:
+            max_entries = int(os.getenv("SCOUTHIRE_JOB_CACHE_SIZE", "256"))
+            db_path = os.getenv("SCOUTHIRE_JOB_CACHE_DB")
+            if db_path:
+                backend = SQLiteCacheBackend(db_path, max_entries=max_entries)
+            else:
+                backend = MemoryCacheBackend(max_entries=max_entries)
+            _job_cache = JobCache(
+                backend,
+                ttl=float(os.getenv("SCOUTHIRE_JOB_CACHE_TTL", "600")),
+                stale_ttl=float(os.getenv("SCOUTHIRE_JOB_CACHE_STALE_TTL", "1800")),
+            )
+        return _job_cache
@@ -0,0 +1,77 @@
+import json
+import os
+import re
+from typing import Any, Dict, List, Tuple
+
+from scouthire_mas.tools.job_dedup import is_missing
+
+# What agents see of a job: a short id and the fields the matcher reasons about. Links, logos,
+# dates and sources never reach the LLM; they are merged back by id when the report is assembled.
+
+# Characters of each description sent to the matcher; 0 sends none.
+COMPACT_DESCRIPTION_CHARS = int(os.getenv("SCOUTHIRE_COMPACT_DESCRIPTION_CHARS", "160"))
+COMPACT_TITLE_CHARS = 90
+SCORING_FIELDS = ("title", "company", "location", "salary", "seniority", "employment_type")
+MAX_TAGS = 6
+
+HIRING_PATTERN = re.compile(r"^.*?\bis hiring\b\s*(?:an?\s+)?", re.I)
+
+
+def estimate_tokens(text: str) -> int:
+    """About four characters per token, close enough to compare two encodings of the same jobs."""
+    return len(text) // 4
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join(str(text).split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0] + "…"
+
+
+def compact_title(title: str) -> str:
+    """HN titles repeat the company ("Acme (YC S21) is hiring a Senior Engineer | Remote"); keep the role."""
+    role = HIRING_PATTERN.sub("", title or "").strip()
+    return _truncate(role or title or "", COMPACT_TITLE_CHARS)
+
+
+def compact_job(job: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+    compact: Dict[str, Any] = {"id": job_id}
+    for field in SCORING_FIELDS:
+        value = job.get(field)
+        if not is_missing(value):
+            compact[field] = compact_title(value) if field == "title" else str(value)
+    tags = [str(tag) for tag in (job.get("tags") or []) if not is_missing(tag)][:MAX_TAGS]
+    if tags:
+        compact["tags"] = tags
+    if job.get("local_score") is not None:
+        compact["local_score"] = job["local_score"]
+    if COMPACT_DESCRIPTION_CHARS and not is_missing(job.get("description")):
+        compact["description"] = _truncate(job["description"], COMPACT_DESCRIPTION_CHARS)
+    return compact
+
+
+def compact_jobs(jobs: List[Dict[str, Any]], prefix: str = "j", start: int = 1) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Compact jobs with ids j1, j2, ... (from j{start}). Returns (compact jobs, id -> original job)."""
+    catalog = {f"{prefix}{i}": job for i, job in enumerate(jobs, start=start)}
+    return [compact_job(job, job_id) for job_id, job in catalog.items()], catalog
+
+
+def dumps(compact: List[Dict[str, Any]]) -> str:
+    return json.dumps(compact, ensure_ascii=False, separators=(",", ":"))
+
+
+def rehydrate(matches: List[Dict[str, Any]], catalog: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn id-keyed matches back into link-keyed ones; ids not in the catalog are dropped."""
+    linked = []
+    for match in matches:
+        job = catalog.get(str(match.get("id", "")).strip())
+        if job is not None and job.get("link"):
+            linked.append({"link": job["link"], "match_score": match.get("match_score", 0), "match_reason": match.get("match_reason", "")})
+    return linked
+
+
+def token_savings(jobs: List[Dict[str, Any]], compact: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Estimated tokens of the jobs as agents used to get them (full dicts, no description) and compacted."""
+    verbose = [{k: v for k, v in job.items() if k != "description"} for job in jobs]
+    return estimate_tokens(json.dumps(verbose, ensure_ascii=False)), estimate_tokens(dumps(compact))
@@ -0,0 +1,224 @@
+import hashlib
+import os
+import re
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+# Estimated Jaccard similarity of title shingles above which two postings at one company are the same job.
+NEAR_DUP_THRESHOLD = float(os.getenv("SCOUTHIRE_DEDUP_THRESHOLD", "0.75"))
+
+# MinHash signature = BANDS x ROWS values. Postings sharing any whole band are compared.
+BANDS = 8
+ROWS = 4
+NUM_PERM = BANDS * ROWS
+
+TRACKING_PARAMS = {
+    "ref", "referrer", "refid", "source", "src", "via", "from", "gclid", "fbclid", "msclkid",
+    "mc_cid", "mc_eid", "trk", "trackingid", "campaign", "cmp",
+}
+HOST_PREFIXES = ("www.", "m.")
+TITLE_ABBREVIATIONS = {
+    "sr": "senior", "jr": "junior", "snr": "senior", "eng": "engineer", "engr": "engineer",
+    "dev": "developer", "mgr": "manager", "swe": "software engineer", "fullstack": "full stack",
+}
+# Words that make two otherwise similar titles different roles ("Junior" / "Senior", "II" / "III")
+SENIORITY_WORDS = {
+    "intern", "junior", "mid", "senior", "staff", "lead", "principal", "head", "chief",
+    "i", "ii", "iii", "iv", "v",
+}
+# Title words that don't change the role: gender markers ("(m/w/d)", "(all genders)") and work mode
+GENDER_MARKER = re.compile(r"\(\s*(?:[mwfdx]\s*/\s*)+[mwfdx]\s*\)|\b[mwfdx](?:\s*/\s*[mwfdx]){2,}\b|\(\s*all genders?\s*\)")
+TITLE_NOISE = {"remote", "hybrid"}
+# Stand-ins for an unknown company, such as the Hacker News parser's fallback
+PLACEHOLDER_COMPANIES = {"yc startup"}
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "gmbh", "corp", "co", "ag", "bv", "sa", "plc", "limited", "corporation"}
+GENERIC_LOCATIONS = {"remote", "global", "anywhere", "worldwide", "only", "yc", "fully", "hybrid"}
+# Fields a later duplicate may fill in when the first record lacks them.
+FILLABLE_FIELDS = ("salary", "seniority", "employment_type", "date_posted", "logo")
+MISSING_VALUES = {"", "not specified", "recent"}
+
+_rng = np.random.default_rng(1729)
+_PERM_A = _rng.integers(1, 2**63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_PERM_B = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+
+
+def canonical_url(link: Optional[str]) -> str:
+    """Link without scheme, www./m. host prefix, tracking parameters, fragment or trailing slash."""
+    if not link:
+        return ""
+    parts = urlsplit(link.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        host = host.removeprefix(prefix)
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    params = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    return urlunsplit(("", host, parts.path.rstrip("/"), urlencode(params), "")).lstrip("/")
+
+
+def _words(text: Any) -> List[str]:
+    return re.sub(r"[^a-z0-9+#]+", " ", str(text or "").lower()).split()
+
+
+def normalize_title(title: Any) -> str:
+    return " ".join(TITLE_ABBREVIATIONS.get(word, word) for word in _words(title))
+
+
+def normalize_company(company: Any) -> str:
+    """Company without legal suffixes; empty when unknown or a placeholder."""
+    name = " ".join(word for word in _words(company) if word not in COMPANY_SUFFIXES)
+    return "" if name in PLACEHOLDER_COMPANIES else name
+
+
+def seniority_words(title: str) -> frozenset:
+    return frozenset(word for word in title.split() if word in SENIORITY_WORDS)
+
+
+def clean_title(title: Any) -> str:
+    """Normalized title without gender markers or work mode ("Sr. Engineer (m/w/d)" -> "senior engineer")."""
+    words = normalize_title(GENDER_MARKER.sub(" ", str(title or "").lower())).split()
+    return " ".join(word for word in words if word not in TITLE_NOISE)
+
+
+def role_words(title: str) -> frozenset:
+    """Words of a cleaned title naming the role, without seniority ("senior python engineer" -> python, engineer)."""
+    return frozenset(word for word in title.split() if word not in SENIORITY_WORDS)
+
+
+def location_tokens(location: Any) -> Set[str]:
+    """Significant location words; empty for remote/global postings."""
+    return {word for word in _words(location) if word not in GENERIC_LOCATIONS}
+
+
+def job_key(job: Dict[str, Any]) -> Optional[int]:
+    """64-bit hash of normalized (company, title, location); None when the company is unknown."""
+    company = normalize_company(job.get("company"))
+    if not company:
+        return None
+    location = " ".join(sorted(location_tokens(job.get("location"))))
+    key = f"{company}|{normalize_title(job.get('title'))}|{location}"
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def minhash(text: str) -> np.ndarray:
+    """MinHash signature over character 3-gram shingles of `text`."""
+    shingles = {text[i:i + 3] for i in range(max(1, len(text) - 2))}
+    base = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    # Universal hashing mod 2^64; uint64 arithmetic wraps around.
+    return (np.outer(base, _PERM_A) + _PERM_B).min(axis=0)
+
+
+def same_company(a: str, b: str) -> bool:
+    """Normalized company names that are equal or one contains the other ('acme' / 'acme labs')."""
+    return bool(a and b) and (a == b or f" {a} " in f" {b} " or f" {b} " in f" {a} ")
+
+
+def is_missing(value: Any) -> bool:
+    """No usable value: None, empty, or a board placeholder like "Not specified"."""
+    return value is None or str(value).strip().lower() in MISSING_VALUES
+
+
+def merge_jobs(group: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """One record for a set of duplicates: the first record, gaps filled from the rest, every source listed."""
+    merged = dict(group[0])
+    merged["sources"] = list(dict.fromkeys(
+        source for job in group for source in job.get("sources") or [job.get("source")] if source
+    ))
+    for job in group[1:]:
+        for field in FILLABLE_FIELDS:
+            if is_missing(merged.get(field)) and not is_missing(job.get(field)):
+                merged[field] = job[field]
+        if len(job.get("description") or "") > len(merged.get("description") or ""):
+            merged["description"] = job["description"]
+    merged["tags"] = list(dict.fromkeys(tag for job in group for tag in job.get("tags") or []))
+    return merged
+
+
+def dedupe_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge postings that are the same job, keeping the order of first appearance.
+
+    A posting joins an earlier group when its canonical link or its (company, title, location)
+    hash matches, or when it shares a MinHash band with a group at the same company whose
+    title signature is similar enough, whose seniority words ("Senior", "II") and remaining
+    title words are the same and whose location does not conflict. Similar titles alone are
+    not enough: "Machine Learning Engineer (NLP)" is another role than "Machine Learning Engineer". A board never lists one job under two links, so postings
+    from the same source with different links stay apart. Each posting does a bounded number
+    of dict lookups, so the pass stays linear in the number of postings.
+    """
+    groups: List[List[Dict[str, Any]]] = []
+    signatures: List[np.ndarray] = []
+    companies: List[str] = []
+    levels: List[frozenset] = []
+    roles: List[frozenset] = []
+    locations: List[Set[str]] = []
+    # (source, canonical link) of every posting in each group
+    listings: List[Set[tuple]] = []
+    by_url: Dict[str, int] = {}
+    by_key: Dict[int, int] = {}
+    by_band: Dict[tuple, int] = {}
+
+    for job in jobs:
+        url = canonical_url(job.get("link"))
+        key = job_key(job)
+        company = normalize_company(job.get("company"))
+        loc = location_tokens(job.get("location"))
+        title = clean_title(job.get("title"))
+        level = seniority_words(title)
+        role = role_words(title)
+        signature = minhash(title)
+        source = job.get("source")
+        # Buckets are per company (first word), so common titles at other companies don't crowd them
+        company_token = company.split(" ", 1)[0]
+        bands = [(company_token, b, signature[b * ROWS:(b + 1) * ROWS].tobytes()) for b in range(BANDS)]
+
+        def other_link_on_board(candidate: int) -> bool:
+            return bool(url) and any(s == source and u and u != url for s, u in listings[candidate])
+
+        group = by_url.get(url) if url else None
+        if group is None and key is not None:
+            group = by_key.get(key)
+            if group is not None and other_link_on_board(group):
+                group = None
+        if group is None and company:
+            for band in bands:
+                candidate = by_band.get(band)
+                if candidate is None or not same_company(company, companies[candidate]):
+                    continue
+                similar = np.mean(signatures[candidate] == signature) >= NEAR_DUP_THRESHOLD
+                compatible = not loc or not locations[candidate] or bool(loc & locations[candidate])
+                same_role = level == levels[candidate] and role == roles[candidate]
+                if similar and compatible and same_role and not other_link_on_board(candidate):
+                    group = candidate
+                    break
+        if group is None:
+            group = len(groups)
+            groups.append([])
+            signatures.append(signature)
+            companies.append(company)
+            levels.append(level)
+            roles.append(role)
+            locations.append(loc)
+            listings.append(set())
+
+        groups[group].append(job)
+        listings[group].add((source, url))
+        if url:
+            by_url.setdefault(url, group)
+        if key is not None:
+            by_key.setdefault(key, group)
+        for band in bands:
+            by_band.setdefault(band, group)
+
+    merged = [merge_jobs(group) for group in groups]
+    if len(merged) < len(jobs):
+        print(f"--- Dedup merged {len(jobs) - len(merged)} duplicate postings ({len(jobs)} -> {len(merged)} jobs) ---")
+    return merged
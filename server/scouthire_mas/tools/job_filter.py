@@ -0,0 +1,263 @@
+import re
+import time
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from scouthire_mas.metrics import JOBS_FILTERED
+from scouthire_mas.tools.job_dedup import is_missing
+
+# Hard constraints are checked here, in Python, after scraping and before any job reaches the LLM.
+# Fields are parsed once per job list into columns; each filter is then a vectorized mask.
+# A job whose value is unknown (no salary, no date, "Not specified") passes that filter.
+
+
+class Seniority(IntEnum):
+    UNKNOWN = 0
+    INTERN = 1
+    JUNIOR = 2
+    MID = 3
+    SENIOR = 4
+    LEAD = 5
+    MANAGER = 6
+
+
+class EmploymentType(IntEnum):
+    UNKNOWN = 0
+    FULL_TIME = 1
+    PART_TIME = 2
+    CONTRACT = 3
+    INTERNSHIP = 4
+    TEMPORARY = 5
+
+
+# First match wins, so more specific words come first ("senior manager" is a manager)
+SENIORITY_PATTERNS = [
+    (Seniority.INTERN, re.compile(r"\b(intern|internship|trainee|werkstudent)\b")),
+    (Seniority.MANAGER, re.compile(r"\b(manager|head of|director|vp|vice president|cto)\b")),
+    (Seniority.LEAD, re.compile(r"\b(lead|staff|principal|architect)\b")),
+    (Seniority.SENIOR, re.compile(r"\b(senior|sr)\b")),
+    (Seniority.JUNIOR, re.compile(r"\b(junior|jr|entry|graduate)\b")),
+    (Seniority.MID, re.compile(r"\b(mid|midweight|mid-level|intermediate|medior)\b")),
+]
+# A board's level field names the level ("Lead", "Manager"); in a title those words are often the
+# role instead ("Product Manager", "Lead Generation Specialist"), so only explicit forms count there.
+_TITLE_LEVELS = {
+    Seniority.MANAGER: re.compile(r"\b(engineering manager|manager of engineering|head of|director|vp|vice president|cto)\b"),
+    Seniority.LEAD: re.compile(r"\b(tech lead|technical lead|team lead|lead (\w+ )?(engineer|developer)|staff|principal|architect)\b"),
+}
+TITLE_SENIORITY_PATTERNS = [(level, _TITLE_LEVELS.get(level, pattern)) for level, pattern in SENIORITY_PATTERNS]
+
+EMPLOYMENT_PATTERNS = [
+    (EmploymentType.INTERNSHIP, re.compile(r"\b(intern|internship|werkstudent)\b")),
+    (EmploymentType.PART_TIME, re.compile(r"\bpart[\s_-]*time\b")),
+    (EmploymentType.CONTRACT, re.compile(r"\b(contract|contractor|freelance)\b")),
+    (EmploymentType.TEMPORARY, re.compile(r"\b(temporary|temp)\b")),
+    (EmploymentType.FULL_TIME, re.compile(r"\b(full[\s_-]*time|permanent)\b")),
+]
+
+# A location open to candidates anywhere, as opposed to "USA" or "Berlin". A "(Remote)" suffix
+# only says the job is remote within the named region, as in Jobicy's "UK (Remote)".
+REMOTE_PATTERN = re.compile(r"\b(remote|anywhere|worldwide|global)\b")
+
+# Names a request may use for a place, and the wider regions whose postings are open to it:
+# a Germany search keeps "EMEA (Remote)", a United States search keeps "USA".
+PLACES = [
+    (("germany", "deutschland"), ("europe", "eu", "emea", "dach")),
+    (("united states", "united states of america", "usa", "us"), ("north america", "americas")),
+    (("united kingdom", "uk", "great britain", "england"), ("europe", "emea")),
+    (("canada",), ("north america", "americas")),
+    (("europe", "eu"), ("emea",)),
+]
+
+_AMOUNT = re.compile(r"(\d+(?:[.,]\d+)*)\s*(k\b)?")
+# Multipliers annualizing a salary quoted per period
+_PERIODS = [
+    (re.compile(r"/\s*h(ou)?r|per hour|hourly"), 2080),
+    (re.compile(r"/\s*day|per day|daily"), 260),
+    (re.compile(r"/\s*w(ee)?k|per week|weekly"), 52),
+    (re.compile(r"/\s*mo(nth)?|per month|monthly"), 12),
+]
+# Bare numbers below this are not an annual salary ("3 years", "2 days in office")
+MIN_ANNUAL_SALARY = 1000
+
+DAY = 86400.0
+
+
+# ---- Parsing ----
+def parse_salary(value: Any) -> Tuple[float, float]:
+    """Annual (min, max) from "$120k - $150k", "90,000 USD", 120000 or "$50/hr"; (nan, nan) if unknown.
+
+    Currencies are not converted: a filter of 100000 compares against the posted figure.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (float(value), float(value)) if value > 0 else (np.nan, np.nan)
+    if is_missing(value):
+        return np.nan, np.nan
+    text = str(value).lower()
+    amounts = []
+    for number, thousands in _AMOUNT.findall(text):
+        # "60.000" and "60,000" are thousands separators; "52.5k" is a decimal
+        if re.fullmatch(r"\d{1,3}([.,]\d{3})+", number):
+            number = re.sub(r"[.,]", "", number)
+        try:
+            amount = float(number.replace(",", "."))
+        except ValueError:
+            continue
+        amounts.append(amount * (1000 if thousands else 1))
+    if not amounts:
+        return np.nan, np.nan
+    multiplier = next((m for pattern, m in _PERIODS if pattern.search(text)), 1)
+    amounts = [amount * multiplier for amount in amounts[:2]]
+    if max(amounts) < MIN_ANNUAL_SALARY:
+        return np.nan, np.nan
+    return min(amounts), max(amounts)
+
+
+def parse_posted(value: Any) -> float:
+    """Unix timestamp from an ISO date, "2026-10-14 00:15:00" or epoch seconds; nan if unknown ("Recent")."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if is_missing(value):
+        return np.nan
+    text = str(value).strip()
+    if text.isdigit():
+        return float(text)
+    try:
+        posted = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return np.nan
+    if posted.tzinfo is None:
+        posted = posted.replace(tzinfo=timezone.utc)
+    return posted.timestamp()
+
+
+def parse_seniority(value: Any, title: str = "") -> Seniority:
+    """Seniority from the board's level, or from the title when the board has none."""
+    for text, patterns in ((value, SENIORITY_PATTERNS), (title, TITLE_SENIORITY_PATTERNS)):
+        if is_missing(text):
+            continue
+        text = str(text).lower()
+        for level, pattern in patterns:
+            if pattern.search(text):
+                return level
+    return Seniority.UNKNOWN
+
+
+def parse_employment_type(value: Any) -> EmploymentType:
+    if is_missing(value):
+        return EmploymentType.UNKNOWN
+    text = str(value).lower()
+    return next((kind for kind, pattern in EMPLOYMENT_PATTERNS if pattern.search(text)), EmploymentType.UNKNOWN)
+
+
+def open_location(job: Dict[str, Any]) -> bool:
+    location = str(job.get("location") or "").lower().replace("(remote)", "")
+    return bool(REMOTE_PATTERN.search(location))
+
+
+def is_remote(job: Dict[str, Any]) -> bool:
+    """Remote work, even when limited to a region (a Remotive posting for "USA" is remote)."""
+    return job.get("remote") is True or "remote" in str(job.get("location") or "").lower() or open_location(job)
+
+
+def _words(text: str) -> str:
+    """Lowercase words, space-separated and padded, so " us " only finds the whole word."""
+    return " " + " ".join(re.findall(r"\w+", text.lower())) + " "
+
+
+def location_text(job: Dict[str, Any]) -> str:
+    """The job's location and country as padded words ("Cologne" on Arbeitnow is " cologne germany ")."""
+    return _words(f"{job.get('location') or ''} {job.get('country') or ''}")
+
+
+def place_terms(location: str) -> List[str]:
+    """The requested place, its other names and the regions containing it, as padded words."""
+    place = _words(location).strip()
+    names, regions = next(((names, regions) for names, regions in PLACES if place in names), ((place,), ()))
+    return [f" {term} " for term in names + regions]
+
+
+def location_matches(job: Dict[str, Any], location: Optional[str]) -> bool:
+    """The job's location names the requested place or a region containing it, or is open to anyone remote."""
+    if not location or location.strip().lower() == "remote":
+        return True
+    text = location_text(job)
+    return any(term in text for term in place_terms(location)) or open_location(job)
+
+
+# ---- Columns ----
+class JobColumns:
+    """Parsed fields of a job list as parallel arrays, one row per job."""
+
+    def __init__(self, jobs: List[Dict[str, Any]]):
+        n = len(jobs)
+        self.salary_min = np.full(n, np.nan)
+        self.salary_max = np.full(n, np.nan)
+        self.posted = np.full(n, np.nan)
+        self.seniority = np.zeros(n, dtype=np.int8)
+        self.employment = np.zeros(n, dtype=np.int8)
+        self.remote = np.zeros(n, dtype=bool)
+        self.open_location = np.zeros(n, dtype=bool)
+        self.location = np.array([location_text(job) for job in jobs], dtype=str)
+        for row, job in enumerate(jobs):
+            self.salary_min[row], self.salary_max[row] = parse_salary(job.get("salary"))
+            self.posted[row] = parse_posted(job.get("date_posted"))
+            self.seniority[row] = parse_seniority(job.get("seniority"), job.get("title") or "")
+            self.employment[row] = parse_employment_type(job.get("employment_type"))
+            self.open_location[row] = open_location(job)
+            self.remote[row] = is_remote(job)
+
+    def location_mask(self, location: Optional[str]) -> np.ndarray:
+        if not location or location.strip().lower() == "remote" or not len(self.location):
+            return np.ones(len(self.remote), dtype=bool)
+        mask = self.open_location.copy()
+        for term in place_terms(location):
+            mask |= np.char.find(self.location, term) >= 0
+        return mask
+
+    def masks(self, location: Optional[str], filters: Any = None, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Boolean keep-mask per active rule. `filters` has optional `min_salary`, `max_age_days`,
+        `seniority`, `employment_types` and `remote_only`, like the request's `filters`."""
+        masks = {"location": self.location_mask(location)}
+        if filters is None:
+            return masks
+        min_salary = getattr(filters, "min_salary", None)
+        if min_salary:
+            # A range reaching the minimum qualifies; unknown salaries pass
+            masks["salary"] = np.isnan(self.salary_max) | (self.salary_max >= min_salary)
+        max_age_days = getattr(filters, "max_age_days", None)
+        if max_age_days:
+            cutoff = (now or time.time()) - max_age_days * DAY
+            masks["age"] = np.isnan(self.posted) | (self.posted >= cutoff)
+        seniority = getattr(filters, "seniority", None)
+        if seniority:
+            levels = [Seniority.UNKNOWN] + [Seniority[str(level).upper()] for level in seniority]
+            masks["seniority"] = np.isin(self.seniority, levels)
+        employment_types = getattr(filters, "employment_types", None)
+        if employment_types:
+            kinds = [EmploymentType.UNKNOWN] + [EmploymentType[str(kind).upper()] for kind in employment_types]
+            masks["employment_type"] = np.isin(self.employment, kinds)
+        if getattr(filters, "remote_only", False):
+            masks["remote"] = self.remote
+        return masks
+
+
+def filter_jobs(jobs: List[Dict[str, Any]], location: Optional[str], filters: Any = None) -> List[Dict[str, Any]]:
+    """Jobs eligible for the requested location and the request's hard filters, in their original order."""
+    if not jobs:
+        return jobs
+    masks = JobColumns(jobs).masks(location, filters)
+    keep = np.ones(len(jobs), dtype=bool)
+    for rule, mask in masks.items():
+        # Counted per rule against the jobs still in play, so each job is dropped by one rule
+        dropped = int(np.count_nonzero(keep & ~mask))
+        if dropped:
+            JOBS_FILTERED.inc(dropped, rule=rule)
+        keep &= mask
+    kept = [jobs[i] for i in np.flatnonzero(keep)]
+    if len(kept) < len(jobs):
+        print(f"--- Filters kept {len(kept)}/{len(jobs)} jobs ({', '.join(masks)}) ---")
+    return kept
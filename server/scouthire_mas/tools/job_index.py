@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from scouthire_mas.tools.job_dedup import canonical_url
+from scouthire_mas.tools.job_filter import location_matches
+
+# Where scouts get their jobs: "live" searches every job board per query (through the job
+# cache); "index" answers from the local full-text index kept fresh by the ingestion worker.
+SCRAPE_MODE = os.getenv("SCOUTHIRE_SCRAPE_MODE", "live")
+INDEX_DB = os.getenv("SCOUTHIRE_INDEX_DB", ".scouthire/job_index.db")
+# Postings not seen by any ingestion run or live scrape for this many seconds are dropped.
+INDEX_MAX_AGE = float(os.getenv("SCOUTHIRE_INDEX_MAX_AGE", str(3 * 86400)))
+INDEX_SEARCH_LIMIT = int(os.getenv("SCOUTHIRE_INDEX_SEARCH_LIMIT", "100"))
+
+# bm25 column weights for (title, company, location, tags, description)
+COLUMN_WEIGHTS = (10.0, 3.0, 1.0, 4.0, 1.0)
+
+
+def posting_id(job: Dict[str, Any]) -> str:
+    """Stable id of one board's posting: its source plus canonical link (or title/company without one)."""
+    key = canonical_url(job.get("link")) or f"{job.get('title')}|{job.get('company')}"
+    return hashlib.sha1(f"{job.get('source')}|{key}".encode("utf-8")).hexdigest()
+
+
+def _match_expression(query: str) -> str:
+    # Quoted terms so user input can't inject FTS5 syntax; any term may match, bm25 ranks.
+    return " OR ".join(f'"{term}"' for term in re.findall(r"\w+", query.lower()))
+
+
+class JobIndex:
+    """SQLite FTS5 index of postings, one row per (source, link).
+
+    `jobs` holds the full record as JSON, `jobs_fts` the searchable text. Each posting
+    keeps the rowid of its full-text row, so updates and expiry delete by rowid instead of
+    scanning the FTS table. Upserts only rewrite the full-text row when a posting's content changed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, source TEXT NOT NULL, data TEXT NOT NULL, content_hash TEXT NOT NULL, "
+                "first_seen REAL NOT NULL, last_seen REAL NOT NULL, fts_rowid INTEGER)"
+            )
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+                "id UNINDEXED, title, company, location, tags, description, tokenize='porter unicode61')"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "fts_rowid" not in columns:
+                self._rebuild_fts(conn)
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen)")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_fts_rowid ON jobs (fts_rowid)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    @staticmethod
+    def _index_text(conn: sqlite3.Connection, job_id: str, record: Dict[str, Any]) -> None:
+        """Add a posting's full-text row and remember its rowid on the posting."""
+        fts_rowid = conn.execute(
+            "INSERT INTO jobs_fts (id, title, company, location, tags, description) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                record.get("title") or "",
+                record.get("company") or "",
+                record.get("location") or "",
+                " ".join(str(tag) for tag in record.get("tags") or []),
+                record.get("description") or "",
+            ),
+        ).lastrowid
+        conn.execute("UPDATE jobs SET fts_rowid = ? WHERE id = ?", (fts_rowid, job_id))
+
+    def _rebuild_fts(self, conn: sqlite3.Connection) -> None:
+        # Indexes from before postings kept their full-text rowid
+        print("--- Job index: rebuilding full-text rows ---")
+        conn.execute("ALTER TABLE jobs ADD COLUMN fts_rowid INTEGER")
+        conn.execute("DELETE FROM jobs_fts")
+        for job_id, data in conn.execute("SELECT id, data FROM jobs").fetchall():
+            self._index_text(conn, job_id, json.loads(data))
+
+    def upsert(self, jobs: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert new postings, refresh changed ones and mark unchanged ones as seen."""
+        now = time.time()
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        with self._lock, self._connect() as conn:
+            for job in jobs:
+                if not job.get("source"):
+                    continue
+                # Merged records are stored as the posting of their first board
+                record = {k: v for k, v in job.items() if k != "sources"}
+                job_id = posting_id(record)
+                data = json.dumps(record, sort_keys=True, default=str)
+                content_hash = hashlib.sha1(data.encode("utf-8")).hexdigest()
+                row = conn.execute("SELECT content_hash, fts_rowid FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                if row is not None and row[0] == content_hash:
+                    conn.execute("UPDATE jobs SET last_seen = ? WHERE id = ?", (now, job_id))
+                    counts["unchanged"] += 1
+                    continue
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO jobs (id, source, data, content_hash, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?)",
+                        (job_id, record["source"], data, content_hash, now, now),
+                    )
+                    counts["inserted"] += 1
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET data = ?, content_hash = ?, last_seen = ? WHERE id = ?",
+                        (data, content_hash, now, job_id),
+                    )
+                    conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (row[1],))
+                    counts["updated"] += 1
+                self._index_text(conn, job_id, record)
+        return counts
+
+    def expire(self, max_age: float = INDEX_MAX_AGE) -> int:
+        """Drop postings not seen for `max_age` seconds. Returns how many were removed."""
+        cutoff = time.time() - max_age
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM jobs_fts WHERE rowid IN (SELECT fts_rowid FROM jobs WHERE last_seen < ?)", (cutoff,))
+            return conn.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,)).rowcount
+
+    def search(self, query: str, location: Optional[str] = None, limit: int = INDEX_SEARCH_LIMIT) -> List[Dict[str, Any]]:
+        """Best `limit` postings for `query` by bm25, keeping those that fit `location`."""
+        expression = _match_expression(query)
+        with self._connect() as conn:
+            if expression:
+                weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+                rows = conn.execute(
+                    f"SELECT jobs.data FROM jobs_fts JOIN jobs ON jobs.fts_rowid = jobs_fts.rowid "
+                    f"WHERE jobs_fts MATCH ? ORDER BY bm25(jobs_fts, {weights}) LIMIT ?",
+                    # Location is filtered afterwards, so over-fetch a little
+                    (expression, limit * 2),
+                ).fetchall()
+            else:
+                rows = conn.execute("SELECT data FROM jobs ORDER BY last_seen DESC LIMIT ?", (limit * 2,)).fetchall()
+        jobs = [json.loads(row[0]) for row in rows]
+        return [job for job in jobs if location_matches(job, location)][:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            by_source = dict(conn.execute("SELECT source, COUNT(*) FROM jobs GROUP BY source").fetchall())
+            oldest, newest = conn.execute("SELECT MIN(last_seen), MAX(last_seen) FROM jobs").fetchone()
+        return {
+            "path": self.path,
+            "size": sum(by_source.values()),
+            "by_source": by_source,
+            "max_age": INDEX_MAX_AGE,
+            "last_ingested": newest,
+            "oldest_seen": oldest,
+        }
+
+
+_job_index: Optional[JobIndex] = None
+_job_index_lock = threading.Lock()
+
+
+def get_job_index() -> JobIndex:
+    """Process-wide job index at SCOUTHIRE_INDEX_DB, shared by every worker using the same file."""
+    global _job_index
+    with _job_index_lock:
+        if _job_index is None:
+            os.makedirs(os.path.dirname(INDEX_DB) or ".", exist_ok=True)
+            _job_index = JobIndex(INDEX_DB)
+        return _job_index
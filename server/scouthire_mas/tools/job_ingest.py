@@ -0,0 +1,104 @@
+"""Background ingestion: pull each job board in bulk into the local job index.
+
+Run once from the server directory, optionally against recorded payloads:
+    python -m scouthire_mas.tools.job_ingest --fixtures fixtures/sources
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from scouthire_mas.tools.job_index import INDEX_MAX_AGE, JobIndex, get_job_index
+from scouthire_mas.tools.scrape_jobs_tool import (
+    ARBEITNOW_API, HN_API, JOBICY_API, REMOTIVE_API,
+    http_get, parse_arbeitnow, parse_hackernews, parse_jobicy, parse_remotive,
+)
+
+# Seconds between ingestion runs of the background worker.
+INGEST_INTERVAL = float(os.getenv("SCOUTHIRE_INGEST_INTERVAL", "900"))
+# Pages pulled from paginated boards per run.
+INGEST_PAGES = int(os.getenv("SCOUTHIRE_INGEST_PAGES", "3"))
+INGEST_TIMEOUT = 30.0
+# Directory of recorded payloads to ingest instead of calling the boards (offline development).
+INGEST_FIXTURES = os.getenv("SCOUTHIRE_INGEST_FIXTURES")
+
+Payloads = Callable[[str, List[str]], List[Dict[str, Any]]]
+
+# (name, bulk URLs, parser). Parsers run without a location so the index holds every posting.
+BULK_SOURCES = [
+    ("Jobicy", [f"{JOBICY_API}/remote-jobs?count=100"], parse_jobicy),
+    ("Remotive", [f"{REMOTIVE_API}/remote-jobs?limit=500"], parse_remotive),
+    ("Arbeitnow", [f"{ARBEITNOW_API}/job-board-api?page={page}" for page in range(1, INGEST_PAGES + 1)], parse_arbeitnow),
+    ("HackerNews", [f"{HN_API}/search_by_date?tags=job&hitsPerPage=200"], parse_hackernews),
+]
+
+
+def http_payloads(name: str, urls: List[str]) -> List[Dict[str, Any]]:
+    """Fetch every bulk URL of a source, stopping at the first page that fails."""
+    payloads = []
+    for url in urls:
+        response = http_get(url, INGEST_TIMEOUT)
+        if response.status_code != 200:
+            print(f"WARNING: {name} bulk pull returned status code {response.status_code}")
+            break
+        payloads.append(response.json())
+    return payloads
+
+
+def fixture_payloads(directory: str) -> Payloads:
+    """Read recorded payloads from `<directory>/<source>.json` (one payload, or a list of pages)."""
+    def load(name: str, urls: List[str]) -> List[Dict[str, Any]]:
+        path = os.path.join(directory, f"{name.lower()}.json")
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, list) else [data]
+    return load
+
+
+def ingest_once(index: Optional[JobIndex] = None, payloads: Payloads = http_payloads) -> Dict[str, Any]:
+    """Pull every source into the index, then expire postings nobody has listed for a while."""
+    index = index or get_job_index()
+    started = time.monotonic()
+    report: Dict[str, Any] = {}
+    for name, urls, parser in BULK_SOURCES:
+        try:
+            jobs = [job for payload in payloads(name, urls) for job in parser(payload, None, limit=None)]
+            report[name] = index.upsert(jobs)
+        except Exception as e:
+            print(f"Error ingesting {name}: {e}")
+            report[name] = {"error": str(e)}
+    report["expired"] = index.expire(INDEX_MAX_AGE)
+    report["seconds"] = round(time.monotonic() - started, 3)
+    print(f"--- Ingestion finished: {report} ---")
+    return report
+
+
+def run_ingest_worker(stop: threading.Event, interval: float = INGEST_INTERVAL) -> None:
+    """Ingest every `interval` seconds until `stop` is set."""
+    payloads = fixture_payloads(INGEST_FIXTURES) if INGEST_FIXTURES else http_payloads
+    while not stop.is_set():
+        try:
+            ingest_once(payloads=payloads)
+        except Exception as e:
+            print(f"Error in ingestion run: {e}")
+        stop.wait(interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pull job boards into the local job index.")
+    parser.add_argument("--fixtures", help="directory of recorded <source>.json payloads to ingest instead of HTTP")
+    parser.add_argument("--db", help="index file (default SCOUTHIRE_INDEX_DB)")
+    args = parser.parse_args()
+    if args.db:
+        os.makedirs(os.path.dirname(args.db) or ".", exist_ok=True)
+    index = JobIndex(args.db) if args.db else get_job_index()
+    ingest_once(index, fixture_payloads(args.fixtures) if args.fixtures else http_payloads)
+    print(json.dumps(index.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
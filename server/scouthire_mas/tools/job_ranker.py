@@ -0,0 +1,147 @@
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+# How many jobs survive pre-ranking and reach the Candidate Matcher LLM.
+PRERANK_TOP_K = int(os.getenv("SCOUTHIRE_PRERANK_TOP_K", "20"))
+# Jobs covering less than this share of the profile's term weight are dropped before any tokens are spent.
+PRERANK_MIN_SCORE = float(os.getenv("SCOUTHIRE_PRERANK_MIN_SCORE", "0.1"))
+# Credit for a profile term found only in the description, relative to one in the title or tags
+DESCRIPTION_TERM_WEIGHT = 0.5
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it",
+    "of", "on", "or", "our", "the", "to", "we", "with", "you", "your", "years", "year", "role",
+    "experience", "looking", "want", "work", "working", "job", "team",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = (t.rstrip(".") for t in _TOKEN_RE.findall((text or "").lower()))
+    return [t for t in tokens if t and t not in _STOPWORDS]
+
+
+def job_text(job: Dict[str, Any]) -> str:
+    """Searchable text for a job. The title is repeated so it outweighs long descriptions."""
+    tags = job.get("tags") or []
+    return " ".join([
+        job.get("title") or "",
+        job.get("title") or "",
+        " ".join(tags) if isinstance(tags, list) else str(tags),
+        job.get("seniority") or "",
+        job.get("description") or "",
+    ])
+
+
+def headline_text(job: Dict[str, Any]) -> str:
+    """Title, tags and seniority: the fields that say what the job is, unlike a long description."""
+    tags = job.get("tags") or []
+    return " ".join([job.get("title") or "", " ".join(tags) if isinstance(tags, list) else str(tags), job.get("seniority") or ""])
+
+
+def profile_terms(profile: Any) -> Counter:
+    """Weighted query terms for a CandidateProfile. Skills count double."""
+    terms = Counter(tokenize(getattr(profile, "skills", "")))
+    terms.update(terms.keys())
+    terms.update(tokenize(getattr(profile, "experience", "")))
+    terms.update(tokenize(getattr(profile, "goals", "")))
+    return terms
+
+
+def bm25_scores(jobs: List[Dict[str, Any]], terms: Counter) -> np.ndarray:
+    """Score every job against the weighted query terms in one batched pass."""
+    if not jobs or not terms:
+        return np.zeros(len(jobs))
+
+    vocab = {term: i for i, term in enumerate(terms)}
+    weights = np.array([terms[t] for t in vocab], dtype=float)
+
+    # Term frequency matrix restricted to the query vocabulary (jobs x terms)
+    tf = np.zeros((len(jobs), len(vocab)))
+    doc_len = np.zeros(len(jobs))
+    for row, job in enumerate(jobs):
+        tokens = tokenize(job_text(job))
+        doc_len[row] = len(tokens)
+        for token in tokens:
+            col = vocab.get(token)
+            if col is not None:
+                tf[row, col] += 1
+
+    n_docs = len(jobs)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+    avg_len = doc_len.mean() or 1.0
+    norm = K1 * (1 - B + B * doc_len / avg_len)
+    saturated = tf * (K1 + 1) / (tf + norm[:, None])
+    return saturated @ (idf * weights)
+
+
+def term_coverage(jobs: List[Dict[str, Any]], terms: Counter) -> np.ndarray:
+    """Share (0-1) of the profile's term weight each job mentions, independent of the other jobs.
+
+    Terms only in the description count for DESCRIPTION_TERM_WEIGHT, so a stray "go" in a
+    marketing description does not make it a match.
+    """
+    if not jobs or not terms:
+        return np.zeros(len(jobs))
+
+    vocab = {term: i for i, term in enumerate(terms)}
+    weights = np.array([terms[t] for t in vocab], dtype=float)
+    credit = np.zeros((len(jobs), len(vocab)))
+    for row, job in enumerate(jobs):
+        for token in set(tokenize(job.get("description") or "")):
+            col = vocab.get(token)
+            if col is not None:
+                credit[row, col] = DESCRIPTION_TERM_WEIGHT
+        for token in set(tokenize(headline_text(job))):
+            col = vocab.get(token)
+            if col is not None:
+                credit[row, col] = 1.0
+    return credit @ weights / weights.sum()
+
+
+def rank_jobs(
+    jobs: List[Dict[str, Any]],
+    profile: Any,
+    top_k: int = PRERANK_TOP_K,
+    min_score: float = PRERANK_MIN_SCORE,
+) -> List[Dict[str, Any]]:
+    """Return the top-K jobs for a profile, best first, each with a 1-100 `local_score`.
+
+    BM25 orders the jobs; `local_score` is the job's own term coverage on a square-root curve
+    (profiles list more terms than any job title repeats), so a batch of weak matches scores low. Jobs with no overlap, or covering less than `min_score`, are dropped.
+    """
+    terms = profile_terms(profile)
+    scores = bm25_scores(jobs, terms)
+    if not len(scores) or scores.max() <= 0:
+        return []
+
+    coverage = term_coverage(jobs, terms)
+    order = np.argsort(-scores, kind="stable")
+    ranked = []
+    for idx in order:
+        if scores[idx] <= 0:
+            break
+        if coverage[idx] < min_score:
+            continue
+        job = dict(jobs[idx])
+        job["local_score"] = int(round(1 + 99 * np.sqrt(coverage[idx])))
+        ranked.append(job)
+        if len(ranked) == top_k:
+            break
+    return ranked
+
+
+def matched_terms(job: Dict[str, Any], profile: Any, limit: int = 5) -> List[str]:
+    """Profile terms that appear in the job, strongest first. Used to explain a local score."""
+    tokens = set(tokenize(job_text(job)))
+    return [term for term, _ in profile_terms(profile).most_common() if term in tokens][:limit]
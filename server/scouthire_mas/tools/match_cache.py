@@ -0,0 +1,122 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from scouthire_mas.tools.job_cache import MemoryCacheBackend, SQLiteCacheBackend
+from scouthire_mas.tools.job_dedup import canonical_url
+
+
+def _norm(text: Any) -> str:
+    return " ".join(str(text or "").lower().split())
+
+
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    """Stable id for a posting: canonical link (tracking parameters dropped) + title + company."""
+    key = "|".join([canonical_url(job.get("link")), _norm(job.get("title")), _norm(job.get("company"))])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def profile_hash(profile: Any) -> str:
+    """Hash of a CandidateProfile that ignores case and whitespace differences."""
+    key = "|".join(_norm(getattr(profile, field, "")) for field in ("experience", "skills", "goals"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class MatchScoreCache:
+    """Memoized matcher output per (job fingerprint, profile hash).
+
+    Jobs the matcher looked at but did not match are remembered too (with a null score),
+    so they are not sent to the LLM again for the same profile. Those verdicts only last
+    `miss_ttl`: a job can be missing from an answer because the answer was cut off.
+    """
+
+    def __init__(self, backend, ttl: float = 86400, miss_ttl: float = 900):
+        self.backend = backend
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(profile_key: str, job: Dict[str, Any]) -> str:
+        return f"{profile_key}:{job_fingerprint(job)}"
+
+    def lookup(self, profile: Any, jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split jobs into cached matches (keyed to the current links) and jobs that still need scoring."""
+        profile_key = profile_hash(profile)
+        keys = [self._key(profile_key, job) for job in jobs]
+        entries = self.backend.get_many(keys)
+        cached, missing = [], []
+        now = time.time()
+        for job, key in zip(jobs, keys):
+            entry = entries.get(key)
+            ttl = self.ttl if entry is not None and entry[0].get("match_score") is not None else self.miss_ttl
+            if entry is None or now - entry[1] >= ttl:
+                missing.append(job)
+                continue
+            value = entry[0]
+            if value.get("match_score") is not None:
+                cached.append({**value, "link": job.get("link")})
+        with self._lock:
+            self.hits += len(jobs) - len(missing)
+            self.misses += len(missing)
+        return cached, missing
+
+    def store(self, profile: Any, jobs: List[Dict[str, Any]], matches: List[Dict[str, Any]]) -> None:
+        """Remember the matcher's verdict for every job it was given.
+
+        An answer that matched none of its jobs may be empty or cut off, so nothing is remembered for it.
+        """
+        profile_key = profile_hash(profile)
+        by_link = {match.get("link"): match for match in matches}
+        if not any(job.get("link") in by_link for job in jobs):
+            return
+        items = []
+        for job in jobs:
+            match = by_link.get(job.get("link"))
+            value = (
+                {"match_score": match.get("match_score"), "match_reason": match.get("match_reason", "")}
+                if match else {"match_score": None}
+            )
+            items.append((self._key(profile_key, job), value))
+        self.backend.set_many(items)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "size": self.backend.size(),
+            "max_entries": self.backend.max_entries,
+            "ttl": self.ttl,
+            "miss_ttl": self.miss_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_match_cache: Optional[MatchScoreCache] = None
+_match_cache_lock = threading.Lock()
+
+
+def get_match_cache() -> MatchScoreCache:
+    """Process-wide match score cache. Disk-backed (SQLite) unless SCOUTHIRE_MATCH_CACHE_DB=memory."""
+    global _match_cache
+    with _match_cache_lock:
+        if _match_cache is None:
+            max_entries = int(os.getenv("SCOUTHIRE_MATCH_CACHE_SIZE", "50000"))
+            db_path = os.getenv("SCOUTHIRE_MATCH_CACHE_DB", ".scouthire/match_scores.db")
+            if db_path == "memory":
+                backend = MemoryCacheBackend(max_entries=max_entries)
+            else:
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                backend = SQLiteCacheBackend(db_path, max_entries=max_entries, table="match_cache")
+            _match_cache = MatchScoreCache(
+                backend,
+                ttl=float(os.getenv("SCOUTHIRE_MATCH_CACHE_TTL", "86400")),
+                miss_ttl=float(os.getenv("SCOUTHIRE_MATCH_CACHE_MISS_TTL", "900")),
+            )
+        return _match_cache
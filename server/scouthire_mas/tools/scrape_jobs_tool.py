@@ -1,9 +1,444 @@
-from typing import Any, Dict, List, Optional
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from crewai.tools import BaseTool
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+from scouthire_mas.metrics import SOURCE_FETCHES, SOURCE_FETCH_SECONDS, SOURCE_JOBS
+from scouthire_mas.tools.job_cache import get_job_cache, normalize_key
+from scouthire_mas.tools.job_compact import compact_jobs
+from scouthire_mas.tools.job_dedup import dedupe_jobs
+from scouthire_mas.tools.job_filter import filter_jobs
+from scouthire_mas.tools.job_index import SCRAPE_MODE, get_job_index
+from scouthire_mas.tools.job_ranker import rank_jobs
+
+
+# Mimic a real browser to avoid 403/526 blocks
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+# Job board API roots. Overridable so benchmarks and offline runs can point at stub servers.
+JOBICY_API = os.getenv("SCOUTHIRE_JOBICY_URL", "https://jobicy.com/api/v2")
+REMOTIVE_API = os.getenv("SCOUTHIRE_REMOTIVE_URL", "https://remotive.io/api")
+ARBEITNOW_API = os.getenv("SCOUTHIRE_ARBEITNOW_URL", "https://www.arbeitnow.com/api")
+HN_API = os.getenv("SCOUTHIRE_HN_URL", "https://hn.algolia.com/api/v1")
+
+# Overall wall-clock budget for one scrape. Sources that have not answered by then
+# are dropped from the result instead of stalling the whole scout.
+SCRAPE_DEADLINE = float(os.getenv("SCOUTHIRE_SCRAPE_DEADLINE", "12"))
+
+# Index mode: when the index has fewer jobs than this for a query, top up with a live scrape.
+INDEX_MIN_RESULTS = int(os.getenv("SCOUTHIRE_INDEX_MIN_RESULTS", "10"))
+INDEX_LIVE_TOPUP = os.getenv("SCOUTHIRE_INDEX_LIVE_TOPUP", "0") == "1"
+
+# Descriptions are kept short: they only feed local ranking, not the agents.
+DESCRIPTION_CHARS = 600
+
+# ---- Shared HTTP session (connection pooling across sources and requests) ----
+_session = requests.Session()
+_session.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Sources are fetched in parallel on a process-wide pool so concurrent scouts share threads.
+_fetch_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="scrape")
+
+
+# Status of the last response on this thread, so a fetch can be labelled by outcome
+_last_status = threading.local()
+
+
+def http_get(url: str, timeout: float) -> requests.Response:
+    response = _session.get(url, timeout=timeout)
+    _last_status.code = response.status_code
+    return response
+
+
+def timed_fetch(name: str, fetcher: Callable, query: str, location: Optional[str], timeout: float, ends: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Run one source's fetcher, recording its latency, outcome and job count.
+
+    With `ends` (a time.monotonic() value), the request timeout is cut to the time left,
+    so the fetch gives its pool thread back by then even when nobody waits for it anymore.
+    """
+    if ends is not None:
+        timeout = min(timeout, ends - time.monotonic())
+        if timeout <= 0:
+            # Queued past the scrape deadline; the caller already reported this source as late
+            return []
+    _last_status.code = None
+    started = time.perf_counter()
+    try:
+        jobs = fetcher(query, location, timeout)
+    except Exception:
+        SOURCE_FETCHES.inc(source=name, status="error")
+        raise
+    finally:
+        SOURCE_FETCH_SECONDS.observe(time.perf_counter() - started, source=name)
+    SOURCE_FETCHES.inc(source=name, status=str(_last_status.code or "ok"))
+    SOURCE_JOBS.inc(len(jobs), source=name)
+    return jobs
+
+
+def _clean_description(html: Optional[str]) -> str:
+    if not html:
+        return ""
+    text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+    return " ".join(text.split())[:DESCRIPTION_CHARS]
+
+
+# Parsers keep every posting; the requested location is applied afterwards by `filter_jobs`.
+
+# ---- Jobicy API (Good for additional global remote jobs) ----
+def _jobicy_salary(job: Dict[str, Any]) -> Any:
+    low, high = job.get("annualSalaryMin"), job.get("annualSalaryMax")
+    if not low:
+        return job.get("salary") or "Not specified"
+    salary = f"{low} - {high}" if high and high != low else str(low)
+    return f"{salary} {job['salaryCurrency']}" if job.get("salaryCurrency") else salary
+
+
+def parse_jobicy(data: Dict[str, Any], location: Optional[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    results = []
+    for job in data.get("jobs", [])[:limit]:
+        results.append({
+            "title": job.get("jobTitle"),
+            "company": job.get("companyName"),
+            "location": f"{job.get('jobGeo', 'Remote')} (Remote)",
+            "remote": True,
+            "salary": _jobicy_salary(job),
+            "seniority": job.get("jobLevel", "Not specified"),
+            # jobType is a list in API v2, e.g. ["full-time"]
+            "employment_type": ", ".join(job_type) if isinstance(job_type := job.get("jobType", "Full Time"), list) else job_type,
+            "date_posted": job.get("pubDate", "Recent"),
+            "link": job.get("url"),
+            "logo": job.get("companyLogo"),
+            "source": "Jobicy",
+            "tags": job.get("jobIndustry") or [],
+            "description": _clean_description(job.get("jobExcerpt") or job.get("jobDescription")),
+        })
+    return results
+
+
+def fetch_jobicy(query: str, location: Optional[str], timeout: float) -> List[Dict[str, Any]]:
+    jobicy_url = f"{JOBICY_API}/remote-jobs?count=20&tag={query}&geo={location if location and location.lower() != 'remote' else ''}"
+    response = http_get(jobicy_url, timeout)
+    if response.status_code != 200:
+        print(f"WARNING: Jobicy API returned status code {response.status_code}")
+        return []
+    data = response.json()
+    print(f"Jobicy: Found {len(data.get('jobs', []))} potential jobs.")
+    return parse_jobicy(data, location)
+
+
+# ---- Remotive API ----
+def parse_remotive(data: Dict[str, Any], location: Optional[str], limit: Optional[int] = 15) -> List[Dict[str, Any]]:
+    results = []
+    for job in data.get("jobs", [])[:limit]:
+        results.append({
+            "title": job.get("title"),
+            "company": job.get("company_name"),
+            # Where candidates must live; every Remotive posting is remote
+            "location": job.get("candidate_required_location", "Remote"),
+            "remote": True,
+            "salary": job.get("salary", "Not specified"),
+            "seniority": "Not specified",
+            "employment_type": job.get("job_type", "Full Time"),
+            "date_posted": job.get("publication_date"),
+            "link": job.get("url"),
+            "logo": job.get("company_logo"),
+            "source": "Remotive",
+            "tags": job.get("tags") or [],
+            "description": _clean_description(job.get("description")),
+        })
+    return results
+
+
+def fetch_remotive(query: str, location: Optional[str], timeout: float) -> List[Dict[str, Any]]:
+    # Remotive URL - official is .io
+    remotive_url = f"{REMOTIVE_API}/remote-jobs?search={query}"
+    response = http_get(remotive_url, timeout)
+    if response.status_code != 200:
+        print(f"WARNING: Remotive API returned status code {response.status_code}")
+        return []
+    try:
+        data = response.json()
+    except ValueError:
+        print(f"ERROR: Remotive response was not JSON. Preview: {response.text[:200]}")
+        return []
+    print(f"Remotive: Found {len(data.get('jobs', []))} potential jobs.")
+    return parse_remotive(data, location)
+
+
+# ---- Arbeitnow API ----
+def parse_arbeitnow(data: Dict[str, Any], location: Optional[str], limit: Optional[int] = 15) -> List[Dict[str, Any]]:
+    results = []
+    for job in data.get("data", [])[:limit]:
+        # Arbeitnow is mostly EU; its location is the office, and remote postings are open to other countries
+        is_remote = bool(job.get("remote", False))
+        job_loc = job.get("location", "Remote")
+        job_types = job.get("job_types") or job.get("job_type") or "Full Time"
+        created_at = job.get("created_at")
+        results.append({
+            "title": job.get("title"),
+            "company": job.get("company_name"),
+            "location": f"{job_loc} / Remote" if is_remote and "remote" not in job_loc.lower() else job_loc,
+            # Arbeitnow lists jobs in Germany and gives only the city
+            "country": "Germany",
+            "remote": is_remote,
+            "salary": "Not specified",
+            "seniority": "Not specified",
+            "employment_type": ", ".join(job_types) if isinstance(job_types, list) else job_types,
+            "date_posted": datetime.fromtimestamp(int(created_at), timezone.utc).isoformat() if created_at else "Recent",
+            "link": job.get("url"),
+            "logo": job.get("logo"),
+            "source": "Arbeitnow",
+            "tags": job.get("tags") or [],
+            "description": _clean_description(job.get("description")),
+        })
+    return results
+
+
+def fetch_arbeitnow(query: str, location: Optional[str], timeout: float) -> List[Dict[str, Any]]:
+    arbeitnow_url = f"{ARBEITNOW_API}/job-board-api?search={query}"
+    response = http_get(arbeitnow_url, timeout)
+    if response.status_code != 200:
+        print(f"WARNING: Arbeitnow API returned status code {response.status_code}")
+        return []
+    data = response.json()
+    print(f"Arbeitnow: Found {len(data.get('data', []))} potential jobs.")
+    return parse_arbeitnow(data, location)
+
+
+# ---- HackerNews Jobs (YC) ----
+def parse_hackernews(data: Dict[str, Any], location: Optional[str], limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+    results = []
+    for hit in data.get("hits", [])[:limit]:
+        title = hit.get("title", "")
+        company = "YC Startup"
+
+        # Extraction logic for typical "Company (YC Batch) is hiring..." format
+        lower_title = title.lower()
+        if " is hiring " in lower_title:
+            company_part = title.split(" is hiring ")[0]
+            # Remove YC batch info like (YC S21)
+            if "(" in company_part:
+                company = company_part.split("(")[0].strip()
+            else:
+                company = company_part.strip()
+        elif " hiring " in lower_title:
+            company_part = title.lower().split(" hiring ")[0]
+            if "(" in company_part:
+                company = title[:len(company_part)].split("(")[0].strip()
+            else:
+                company = title[:len(company_part)].strip()
+        else:
+            # Sometimes title is just "Company: Role" or just "Role at Company"
+            if " at " in title:
+                 company = title.split(" at ")[-1].strip()
+            elif ":" in title:
+                 company = title.split(":")[0].strip()
+
+        # Infer seniority/type from title
+        seniority = "Not specified"
+        if "senior" in lower_title: seniority = "Senior"
+        elif "junior" in lower_title: seniority = "Junior"
+        elif "staff" in lower_title: seniority = "Staff"
+        elif re.search(r"\bintern(ship)?\b", lower_title): seniority = "Intern"
+
+        results.append({
+            "title": title,
+            "company": company,
+            "location": "Remote (Global) / YC",
+            "salary": "Not specified",
+            "seniority": seniority,
+            "employment_type": "Full Time",
+            "date_posted": hit.get("created_at"),
+            "link": hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID')}",
+            "logo": "https://upload.wikimedia.org/wikipedia/commons/b/b2/Y_Combinator_logo.svg",
+            "source": "HackerNews",
+            "tags": [],
+            "description": _clean_description(hit.get("story_text")),
+        })
+    return results
+
+
+def fetch_hackernews(query: str, location: Optional[str], timeout: float) -> List[Dict[str, Any]]:
+    # 'job' tag searches strictly for YC job posts
+    hn_search_url = f"{HN_API}/search?query={query}&tags=job"
+    response = http_get(hn_search_url, timeout)
+    if response.status_code != 200:
+        print(f"WARNING: Hacker News API returned status code {response.status_code}")
+        return []
+    data = response.json()
+    print(f"Hacker News: Found {len(data.get('hits', []))} matching job threads.")
+    return parse_hackernews(data, location)
+
+
+# (name, fetcher, per-source timeout in seconds). Order here is the order of the merged result.
+SOURCES = [
+    ("Jobicy", fetch_jobicy, 10.0),
+    ("Remotive", fetch_remotive, 10.0),
+    ("Arbeitnow", fetch_arbeitnow, 8.0),
+    ("HackerNews", fetch_hackernews, 8.0),
+]
+
+
+def fetch_all_sources(
+    query: str,
+    location: Optional[str],
+    deadline: float = SCRAPE_DEADLINE,
+    on_source: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch every source concurrently and merge whatever arrives before `deadline`.
+
+    `on_source(name, jobs)` is called as each source completes, in completion order.
+    Postings listed on several boards come back once, with every board in `sources`.
+    Each request's timeout is the time left until the deadline, so a late source is not
+    waited for and its fetch stops holding a pool thread by then.
+    """
+    started = time.monotonic()
+    ends = started + deadline
+    futures = {
+        _fetch_pool.submit(timed_fetch, name, fetcher, query, location, timeout, ends): name
+        for name, fetcher, timeout in SOURCES
+    }
+    by_source: Dict[str, List[Dict[str, Any]]] = {}
+
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            name = futures[future]
+            try:
+                jobs = future.result()
+            except Exception as e:
+                print(f"Error fetching from {name}: {e}")
+                jobs = []
+            by_source[name] = jobs
+            if on_source:
+                try:
+                    on_source(name, jobs)
+                except Exception as e:
+                    print(f"Error reporting {name} results: {e}")
+    except FuturesTimeoutError:
+        late = [name for future, name in futures.items() if not future.done()]
+        for name in late:
+            SOURCE_FETCHES.inc(source=name, status="late")
+        # Fetches still queued are dropped; running ones time out on their own
+        for future in futures:
+            future.cancel()
+        print(f"WARNING: Scrape deadline of {deadline}s reached, skipping late sources: {', '.join(late)}")
+
+    print(f"--- Scrape finished in {time.monotonic() - started:.2f}s ({len(by_source)}/{len(SOURCES)} sources) ---")
+
+    results = []
+    for name, _, _ in SOURCES:
+        results.extend(by_source.get(name, []))
+    return dedupe_jobs(results)
+
+
+def report_sources(
+    on_source: Optional[Callable[[str, List[Dict[str, Any]]], None]],
+    jobs: List[Dict[str, Any]],
+    skip: Optional[set] = None,
+) -> None:
+    """Call `on_source(name, jobs)` per job board with the listings it contributed to `jobs`."""
+    if not on_source:
+        return
+    for name, _, _ in SOURCES:
+        if name not in (skip or ()):
+            on_source(name, [job for job in jobs if name in job.get("sources", [job.get("source")])])
+
+
+def fetch_live_jobs(
+    query: str,
+    location: Optional[str],
+    on_source: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Search every job board for a query, served through the job cache.
+
+    `on_source(name, jobs)` fires per job board, replayed from the cached list on a hit.
+    """
+    reported = set()
+    finished = False
+
+    def report_source(name: str, source_jobs: List[Dict[str, Any]]) -> None:
+        # A background cache refresh may finish after this call returned; stay quiet then.
+        if on_source and not finished:
+            reported.add(name)
+            on_source(name, source_jobs)
+
+    jobs = get_job_cache().get_or_fetch(
+        normalize_key(query, location),
+        lambda: fetch_all_sources(query, location, on_source=report_source),
+    )
+    finished = True
+
+    # Served from cache: report the cached listings per source so callers see the same events.
+    report_sources(on_source, jobs, skip=reported)
+    return jobs
+
+
+def fetch_indexed_jobs(
+    query: str,
+    location: Optional[str],
+    on_source: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Answer from the local job index, topping up with a live scrape when it has too few jobs."""
+    started = time.monotonic()
+    index = get_job_index()
+    jobs = index.search(query, location)
+    print(f"--- Job index answered in {(time.monotonic() - started) * 1000:.1f}ms with {len(jobs)} postings ---")
+    if INDEX_LIVE_TOPUP and len(jobs) < INDEX_MIN_RESULTS:
+        live_jobs = fetch_live_jobs(query, location)
+        # Live results keep the index fresh for the next query too
+        index.upsert(live_jobs)
+        jobs = jobs + live_jobs
+    jobs = dedupe_jobs(jobs)
+    report_sources(on_source, jobs)
+    return jobs
+
+
+def fetch_jobs(
+    query: str,
+    location: Optional[str],
+    on_source: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Full scraped records (descriptions included) for a query, from the boards or the local index.
+
+    `on_source(name, jobs)` fires once per job board with the listings it contributed.
+    """
+    print(f"--- Fetching jobs for '{query}' in '{location}' ({SCRAPE_MODE} mode) ---")
+    if SCRAPE_MODE == "index":
+        return fetch_indexed_jobs(query, location, on_source)
+    return fetch_live_jobs(query, location, on_source)
+
+
+def select_jobs(jobs: List[Dict[str, Any]], candidate_profile: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """Pre-rank against a profile when given. Agents get these through `compact_jobs`."""
+    if candidate_profile is not None:
+        ranked = rank_jobs(jobs, candidate_profile)
+        print(f"--- Pre-ranking kept {len(ranked)}/{len(jobs)} jobs ---")
+        jobs = ranked
+    return jobs
 
 
 class ScrapeJobsTool(BaseTool):
@@ -16,172 +451,25 @@ class ScrapeJobsTool(BaseTool):
         default="Remote", description="Job location (e.g., 'Remote', 'New York')."
     )
 
+    # Not a tool argument: when set, results are pre-ranked against this CandidateProfile
+    # and only the top-K are handed to the agents.
+    candidate_profile: Optional[Any] = Field(default=None, exclude=True)
+    # Not a tool argument: the request's hard filters (salary, age, seniority, remote), applied before ranking.
+    filters: Optional[Any] = Field(default=None, exclude=True)
+    # Not a tool argument: called with (source_name, jobs) as each job board returns.
+    on_source: Optional[Callable[[str, List[Dict[str, Any]]], None]] = Field(default=None, exclude=True)
+    # Not a tool argument: when set, the agent gets compact jobs and this is called with their id -> job catalog.
+    # A callable rather than a dict, because pydantic copies a dict field on validation.
+    on_catalog: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = Field(default=None, exclude=True)
+    # Ids handed out so far, so a second call continues at j{n+1} instead of reusing j1
+    _issued: int = PrivateAttr(default=0)
+
     def _run(self, query: str, location: Optional[str] = None) -> List[Dict[str, Any]]:
-        results = []
-        # Mimic a real browser to avoid 403/526 blocks
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        }
-
-        print(f"--- Fetching jobs for '{query}' in '{location}' ---")
-
-        # ---- Jobicy API (Good for additional global remote jobs) ----
-        try:
-            jobicy_url = f"https://jobicy.com/api/v2/remote-jobs?count=20&tag={query}&geo={location if location and location.lower() != 'remote' else ''}"
-            response = requests.get(jobicy_url, timeout=15, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get("jobs", [])
-                print(f"Jobicy: Found {len(jobs)} potential jobs.")
-                for job in jobs:
-                    results.append({
-                        "title": job.get("jobTitle"),
-                        "company": job.get("companyName"),
-                        "location": f"{job.get('jobGeo', 'Remote')} (Remote)",
-                        "salary": job.get("annualSalaryMin") or job.get("salary") or "Not specified",
-                        "seniority": job.get("jobLevel", "Not specified"),
-                        "employment_type": job.get("jobType", "Full Time"),
-                        "date_posted": job.get("pubDate", "Recent"),
-                        "link": job.get("url"),
-                        "logo": job.get("companyLogo"),
-                        "source": "Jobicy",
-                    })
-        except Exception as e:
-            print(f"Error fetching from Jobicy: {e}")
-
-        # ---- Remotive API ----
-        try:
-            # Remotive URL - official is .io
-            remotive_url = f"https://remotive.io/api/remote-jobs?search={query}"
-            response = requests.get(remotive_url, timeout=15, headers=headers)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    jobs = data.get("jobs", [])
-                    print(f"Remotive: Found {len(jobs)} potential jobs.")
-                    for job in jobs[:15]:
-                        # Filter by location if specified and not just "Remote"
-                        job_loc = job.get("candidate_required_location", "Remote")
-                        if location and location.lower() != "remote" and location.lower() not in job_loc.lower() and "remote" not in job_loc.lower():
-                            continue
-                            
-                        results.append({
-                            "title": job.get("title"),
-                            "company": job.get("company_name"),
-                            "location": job_loc,
-                            "salary": job.get("salary", "Not specified"),
-                            "seniority": "Not specified",
-                            "employment_type": job.get("job_type", "Full Time"),
-                            "date_posted": job.get("publication_date"),
-                            "link": job.get("url"),
-                            "logo": job.get("company_logo"),
-                            "source": "Remotive",
-                        })
-                except ValueError:
-                    print(f"ERROR: Remotive response was not JSON. Preview: {response.text[:200]}")
-            else:
-                print(f"WARNING: Remotive API returned status code {response.status_code}")
-        except Exception as e:
-            print(f"Error fetching from Remotive: {e}")
-
-        # ---- Arbeitnow API ----
-        try:
-            arbeitnow_url = f"https://www.arbeitnow.com/api/job-board-api?search={query}"
-            response = requests.get(arbeitnow_url, timeout=10, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get("data", [])
-                print(f"Arbeitnow: Found {len(jobs)} potential jobs.")
-                for job in jobs[:15]:
-                    # Arbeitnow is mostly EU. If user wants USA, we might skip unless it's remote.
-                    job_loc = job.get("location", "Remote")
-                    is_remote = job.get("remote", False)
-                    
-                    if location and location.lower() == "usa" and "germany" in job_loc.lower() and not is_remote:
-                        continue
-
-                    results.append({
-                        "title": job.get("title"),
-                        "company": job.get("company_name"),
-                        "location": job_loc,
-                        "salary": "Not specified",
-                        "seniority": "Not specified",
-                        "employment_type": job.get("job_type", "Full Time"),
-                        "date_posted": "Recent",
-                        "link": job.get("url"),
-                        "logo": job.get("logo"), 
-                        "source": "Arbeitnow",
-                    })
-            else:
-                print(f"WARNING: Arbeitnow API returned status code {response.status_code}")
-        except Exception as e:
-            print(f"Error fetching from Arbeitnow: {e}")
-
-        # ---- HackerNews Jobs (YC) ----
-        try:
-            # 'job' tag searches strictly for YC job posts
-            hn_search_url = f"https://hn.algolia.com/api/v1/search?query={query}&tags=job"
-            response = requests.get(hn_search_url, timeout=10, headers=headers)
-            if response.status_code == 200:
-                hits = response.json().get("hits", [])
-                print(f"Hacker News: Found {len(hits)} matching job threads.")
-                for hit in hits[:10]:
-                    title = hit.get("title", "")
-                    company = "YC Startup"
-                    
-                    # Extraction logic for typical "Company (YC Batch) is hiring..." format
-                    lower_title = title.lower()
-                    if " is hiring " in lower_title:
-                        company_part = title.split(" is hiring ")[0]
-                        # Remove YC batch info like (YC S21)
-                        if "(" in company_part:
-                            company = company_part.split("(")[0].strip()
-                        else:
-                            company = company_part.strip()
-                    elif " hiring " in lower_title:
-                        company_part = title.lower().split(" hiring ")[0]
-                        if "(" in company_part:
-                            company = title[:len(company_part)].split("(")[0].strip()
-                        else:
-                            company = title[:len(company_part)].strip()
-                    else:
-                        # Sometimes title is just "Company: Role" or just "Role at Company"
-                        if " at " in title:
-                             company = title.split(" at ")[-1].strip()
-                        elif ":" in title:
-                             company = title.split(":")[0].strip()
-
-                    # Infer seniority/type from title
-                    seniority = "Not specified"
-                    if "senior" in lower_title: seniority = "Senior"
-                    elif "junior" in lower_title: seniority = "Junior"
-                    elif "staff" in lower_title: seniority = "Staff"
-                    elif "intern" in lower_title: seniority = "Intern"
-
-                    results.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote (Global) / YC",
-                        "salary": "Not specified",
-                        "seniority": seniority,
-                        "employment_type": "Full Time",
-                        "date_posted": hit.get("created_at"),
-                        "link": hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID')}",
-                        "logo": "https://upload.wikimedia.org/wikipedia/commons/b/b2/Y_Combinator_logo.svg", 
-                        "source": "HackerNews",
-                    })
-        except Exception as e:
-            print(f"Error fetching from HN: {e}")
-
-        return results
+        jobs = filter_jobs(fetch_jobs(query, location, self.on_source), location, self.filters)
+        jobs = select_jobs(jobs, self.candidate_profile)
+        if self.on_catalog is None:
+            return [{k: v for k, v in job.items() if k != "description"} for job in jobs]
+        compact, catalog = compact_jobs(jobs, start=self._issued + 1)
+        self._issued += len(catalog)
+        self.on_catalog(catalog)
+        return compact
@@ -0,0 +1,45 @@
+import json
+import re
+
+from crewai.llms.base_llm import BaseLLM
+
+from app.model.schemas import CandidateProfile
+from scouthire_mas import crew
+from scouthire_mas.tools import scrape_jobs_tool
+
+JOBS = [
+    {"title": "Senior Python Engineer", "company": "Acme", "location": "Remote", "salary": "$150k",
+     "description": "Python, FastAPI and PostgreSQL services.", "link": "https://acme.example/jobs/1", "source": "Jobicy"},
+    {"title": "Backend Developer (Python)", "company": "Globex", "location": "Remote", "salary": "Not specified",
+     "description": "Django and Python APIs.", "link": "https://globex.example/jobs/2", "source": "Remotive"},
+]
+
+IDS = re.compile(r"[\"']id[\"']:\s*[\"'](j\d+)[\"']")
+
+
+class ScriptedLLM(BaseLLM):
+    """Plays the three agents: the scraper calls its tool, the others score every job id they were shown."""
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None, response_model=None):
+        prompt = messages if isinstance(messages, str) else "\n".join(str(m.get("content", "")) for m in messages)
+        ids = sorted(set(IDS.findall(prompt)))
+        if "You are Job Scraper" in prompt and not ids:
+            return 'Thought: I should search.\nAction: scrape_jobs\nAction Input: {"query": "python", "location": "Remote"}'
+        if "You are Job Scraper" in prompt:
+            return f"Thought: I have the jobs.\nFinal Answer: {json.dumps([{'id': job_id} for job_id in ids])}"
+        matches = [{"id": job_id, "match_score": 80, "match_reason": "Python backend work."} for job_id in ids]
+        return f"Thought: Done.\nFinal Answer: {json.dumps({'summary': 'Two Python roles.', 'matches': matches})}"
+
+
+def test_agents_mode_returns_the_scraped_jobs(monkeypatch):
+    # Like ScoutRuntime: no telemetry export on kickoff
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setattr(scrape_jobs_tool, "fetch_jobs", lambda query, location=None, on_source=None: list(JOBS))
+    profile = CandidateProfile(experience="Five years of backend work.", skills="Python, FastAPI", goals="Senior Python role")
+
+    report = crew.run_agent_pipeline(ScriptedLLM(model="scripted"), "python", "Remote", profile)
+
+    assert {job["link"] for job in report["jobs"]} == {job["link"] for job in JOBS}
@@ -0,0 +1,81 @@
+from scouthire_mas.tools.job_dedup import dedupe_jobs
+
+
+def posting(title, company="Acme", source="Jobicy", link=None, location="Remote", **extra):
+    slug = title.lower().replace(" ", "-")
+    return {
+        "title": title,
+        "company": company,
+        "source": source,
+        "location": location,
+        "link": link if link is not None else f"https://{source.lower()}.com/jobs/{slug}",
+        **extra,
+    }
+
+
+def titles(jobs):
+    return [job["title"] for job in jobs]
+
+
+def test_same_job_on_two_boards_is_merged():
+    jobs = dedupe_jobs([
+        posting("Senior Python Engineer", salary="Not specified"),
+        posting("Sr. Python Engineer", source="Remotive", salary="$120k - $150k"),
+    ])
+    assert titles(jobs) == ["Senior Python Engineer"]
+    assert jobs[0]["sources"] == ["Jobicy", "Remotive"]
+    assert jobs[0]["salary"] == "$120k - $150k"
+
+
+def test_tracking_link_is_the_same_posting():
+    jobs = dedupe_jobs([
+        posting("Data Engineer", link="https://jobicy.com/jobs/1"),
+        posting("Data Engineer", source="Remotive", link="https://www.jobicy.com/jobs/1/?utm_source=x&ref=feed"),
+    ])
+    assert len(jobs) == 1
+
+
+def test_seniority_levels_stay_apart():
+    jobs = dedupe_jobs([
+        posting("Senior Python Developer"),
+        posting("Junior Python Developer", source="Remotive"),
+        posting("Software Engineer II"),
+        posting("Software Engineer III", source="Remotive"),
+    ])
+    assert titles(jobs) == ["Senior Python Developer", "Junior Python Developer", "Software Engineer II", "Software Engineer III"]
+
+
+def test_one_board_never_lists_a_job_twice():
+    # Same title, company and location, but separate postings (different links) on one board
+    jobs = dedupe_jobs([
+        posting("Backend Engineer", link="https://jobicy.com/jobs/1"),
+        posting("Backend Engineer", link="https://jobicy.com/jobs/2"),
+    ])
+    assert len(jobs) == 2
+
+
+def test_unknown_or_placeholder_company_does_not_merge():
+    jobs = dedupe_jobs([
+        posting("Founding Engineer", company="YC Startup", source="HackerNews", link="https://news.ycombinator.com/item?id=1"),
+        posting("Founding Engineer", company="YC Startup", source="Remotive"),
+        posting("Founding Engineer", company="", source="Arbeitnow"),
+    ])
+    assert len(jobs) == 3
+
+
+def test_similar_titles_of_different_roles_stay_apart():
+    jobs = dedupe_jobs([
+        posting("Machine Learning Engineer"),
+        posting("Machine Learning Engineer (NLP)", source="Remotive"),
+        posting("Engineering Manager, Infrastructure"),
+        posting("Engineering Manager, Infrastructure Security", source="Remotive"),
+    ])
+    assert len(jobs) == 4
+
+
+def test_gender_marker_and_work_mode_are_ignored():
+    jobs = dedupe_jobs([
+        posting("Senior Backend Engineer (m/w/d)", source="Arbeitnow"),
+        posting("Sr. Backend Engineer - Remote", source="Remotive"),
+    ])
+    assert len(jobs) == 1
@@ -0,0 +1,77 @@
+import json
+import math
+import os
+from types import SimpleNamespace
+
+from scouthire_mas.tools.job_filter import EmploymentType, Seniority, filter_jobs, location_matches, parse_employment_type, parse_salary, parse_seniority
+from scouthire_mas.tools.scrape_jobs_tool import parse_arbeitnow, parse_jobicy
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "sources")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, f"{name}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_internal_is_not_an_internship():
+    assert parse_employment_type("Internal") == EmploymentType.UNKNOWN
+    assert parse_seniority("Not specified", "Internal Tools Engineer") == Seniority.UNKNOWN
+    assert parse_employment_type("Internship") == EmploymentType.INTERNSHIP
+    assert parse_seniority(None, "Software Engineering Intern") == Seniority.INTERN
+
+
+def test_role_words_in_titles_are_not_levels():
+    assert parse_seniority(None, "Product Manager") == Seniority.UNKNOWN
+    assert parse_seniority(None, "Lead Generation Specialist") == Seniority.UNKNOWN
+    assert parse_seniority(None, "Senior Product Manager") == Seniority.SENIOR
+
+
+def test_explicit_manager_and_lead_titles():
+    assert parse_seniority(None, "Engineering Manager") == Seniority.MANAGER
+    assert parse_seniority(None, "Tech Lead, Payments") == Seniority.LEAD
+    assert parse_seniority(None, "Team Lead") == Seniority.LEAD
+    assert parse_seniority(None, "Lead Backend Engineer") == Seniority.LEAD
+
+
+def test_board_level_names_keep_their_meaning():
+    assert parse_seniority("Manager", "Product Manager") == Seniority.MANAGER
+    assert parse_seniority("Lead", "Data Engineer") == Seniority.LEAD
+
+
+def test_salary_formats():
+    assert parse_salary("$120k - $150k") == (120000, 150000)
+    assert parse_salary("60.000 EUR") == (60000, 60000)
+    assert parse_salary("$50/hr") == (104000, 104000)
+    assert all(math.isnan(value) for value in parse_salary("Not specified"))
+
+
+def test_seniority_filter_keeps_a_senior_product_manager():
+    jobs = [
+        {"title": "Senior Product Manager", "location": "Remote"},
+        {"title": "Engineering Manager", "location": "Remote"},
+        {"title": "Lead Generation Specialist", "location": "Remote"},
+    ]
+    kept = filter_jobs(jobs, "Remote", SimpleNamespace(seniority=["senior"]))
+    # Unknown levels pass; only the explicit manager is dropped
+    assert [job["title"] for job in kept] == ["Senior Product Manager", "Lead Generation Specialist"]
+
+
+def test_germany_keeps_every_arbeitnow_posting():
+    jobs = parse_arbeitnow(load_fixture("arbeitnow"), "Germany", None)
+    # On-site jobs in Cologne, Hamburg and Munich never name the country
+    assert filter_jobs(jobs, "Germany") == jobs
+
+
+def test_united_states_matches_jobicy_usa():
+    jobs = parse_jobicy(load_fixture("jobicy"), "United States")
+    kept = {job["location"] for job in filter_jobs(jobs, "United States")}
+    assert kept == {"USA (Remote)", "Anywhere (Remote)"}
+
+
+def test_remote_region_containing_the_place_matches():
+    assert location_matches({"location": "EMEA (Remote)"}, "Germany")
+    assert location_matches({"location": "Europe (Remote)"}, "Germany")
+    assert not location_matches({"location": "UK (Remote)"}, "USA")
+    # "us" is a whole word, not part of "Australia"
+    assert not location_matches({"location": "Australia"}, "US")
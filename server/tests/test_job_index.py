@@ -0,0 +1,42 @@
+import sqlite3
+
+from scouthire_mas.tools.job_index import JobIndex
+
+
+def posting(title, link, **extra):
+    return {"title": title, "company": "Acme", "location": "Remote", "source": "Jobicy", "link": link, "tags": [], **extra}
+
+
+def fts_rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM jobs_fts").fetchone()[0]
+
+
+def test_upsert_replaces_the_full_text_row(tmp_path):
+    path = str(tmp_path / "index.db")
+    index = JobIndex(path)
+    assert index.upsert([posting("Rust Engineer", "https://jobicy.com/jobs/1")])["inserted"] == 1
+    counts = index.upsert([posting("Kotlin Engineer", "https://jobicy.com/jobs/1")])
+    assert counts["updated"] == 1
+    assert index.search("rust") == []
+    assert [job["title"] for job in index.search("kotlin")] == ["Kotlin Engineer"]
+    assert fts_rows(path) == 1
+
+
+def test_expire_drops_postings_and_their_text(tmp_path):
+    path = str(tmp_path / "index.db")
+    index = JobIndex(path)
+    index.upsert([posting("Rust Engineer", "https://jobicy.com/jobs/1"), posting("Go Engineer", "https://jobicy.com/jobs/2")])
+    assert index.expire(max_age=-1) == 2
+    assert index.search("engineer") == []
+    assert fts_rows(path) == 0
+
+
+def test_search_keeps_postings_in_the_requested_country(tmp_path):
+    index = JobIndex(str(tmp_path / "index.db"))
+    index.upsert([
+        posting("Rust Engineer", "https://arbeitnow.com/jobs/1", location="Cologne", country="Germany", source="Arbeitnow"),
+        posting("Rust Developer", "https://jobicy.com/jobs/2", location="EMEA (Remote)"),
+        posting("Rust Lead", "https://jobicy.com/jobs/3", location="USA (Remote)"),
+    ])
+    assert {job["title"] for job in index.search("rust", "Germany")} == {"Rust Engineer", "Rust Developer"}
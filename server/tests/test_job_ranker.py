@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+from scouthire_mas.tools.job_ranker import rank_jobs
+
+RUST_PROFILE = SimpleNamespace(
+    skills="Rust, Kubernetes, Go",
+    experience="6 years backend distributed systems",
+    goals="Senior platform engineering role",
+)
+
+MARKETING = {"title": "Marketing Manager", "description": "Go to market strategy, campaigns and brand", "tags": []}
+RUST = {
+    "title": "Senior Rust Engineer",
+    "description": "Build distributed systems in Rust and Go on Kubernetes",
+    "tags": ["rust", "kubernetes"],
+}
+
+
+def test_weak_match_alone_is_dropped():
+    # Alone in its batch, the marketing job used to be the best job and score 100
+    assert rank_jobs([MARKETING], RUST_PROFILE) == []
+
+
+def test_local_score_does_not_depend_on_the_batch():
+    alone = rank_jobs([RUST], RUST_PROFILE)
+    together = rank_jobs([MARKETING, RUST], RUST_PROFILE)
+    assert [job["title"] for job in together] == ["Senior Rust Engineer"]
+    assert together[0]["local_score"] == alone[0]["local_score"] < 100
+
+
+def test_better_coverage_scores_higher():
+    partial = {"title": "Go Developer", "description": "Web services", "tags": []}
+    ranked = rank_jobs([partial, RUST], RUST_PROFILE, min_score=0)
+    assert [job["title"] for job in ranked] == ["Senior Rust Engineer", "Go Developer"]
+    assert ranked[0]["local_score"] > ranked[1]["local_score"]
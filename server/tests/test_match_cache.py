@@ -0,0 +1,39 @@
+import time
+from types import SimpleNamespace
+
+from scouthire_mas.tools.job_cache import MemoryCacheBackend
+from scouthire_mas.tools.match_cache import MatchScoreCache, job_fingerprint
+
+PROFILE = SimpleNamespace(experience="5 years", skills="Python", goals="Backend role")
+JOBS = [{"title": f"Engineer {i}", "company": "Acme", "link": f"https://jobicy.com/jobs/{i}"} for i in range(3)]
+
+
+def test_tracking_link_has_the_same_fingerprint():
+    job = {"title": "Data Engineer", "company": "Acme", "link": "https://jobicy.com/jobs/1"}
+    tracked = {**job, "link": "http://www.jobicy.com/jobs/1/?utm_source=feed&ref=hn#apply"}
+    assert job_fingerprint(tracked) == job_fingerprint(job)
+
+
+def test_different_postings_have_different_fingerprints():
+    job = {"title": "Data Engineer", "company": "Acme", "link": "https://jobicy.com/jobs/1"}
+    assert job_fingerprint({**job, "link": "https://jobicy.com/jobs/2"}) != job_fingerprint(job)
+
+
+def test_jobs_left_out_of_an_answer_are_skipped_briefly(monkeypatch):
+    cache = MatchScoreCache(MemoryCacheBackend(max_entries=100), ttl=3600, miss_ttl=60)
+    cache.store(PROFILE, JOBS, [{"link": JOBS[0]["link"], "match_score": 90, "match_reason": "Python."}])
+    cached, missing = cache.lookup(PROFILE, JOBS)
+    assert [match["match_score"] for match in cached] == [90] and missing == []
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    cached, missing = cache.lookup(PROFILE, JOBS)
+    # The match is still cached; the jobs it left out are scored again
+    assert [match["match_score"] for match in cached] == [90]
+    assert missing == JOBS[1:]
+
+
+def test_an_answer_without_matches_is_not_remembered():
+    cache = MatchScoreCache(MemoryCacheBackend(max_entries=100))
+    cache.store(PROFILE, JOBS, [])
+    assert cache.lookup(PROFILE, JOBS) == ([], JOBS)
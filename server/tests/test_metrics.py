@@ -0,0 +1,22 @@
+import threading
+import time
+
+from scouthire_mas.metrics import ScoutTimings
+
+
+def test_parallel_runs_of_a_stage_count_once():
+    timings = ScoutTimings()
+
+    def score():
+        with timings.stage("scoring"):
+            time.sleep(0.2)
+
+    threads = [threading.Thread(target=score) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    summary = timings.summary()
+    # Three profiles scoring side by side take 0.2 s of the scout, not 0.6 s
+    assert 200 <= summary["stages_ms"]["scoring"] < 400
+    assert summary["stages_ms"]["scoring"] <= summary["total_ms"]
@@ -0,0 +1,40 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from scouthire_mas.tools import scrape_jobs_tool
+
+
+def test_queued_fetch_does_not_outlive_the_scrape_deadline(monkeypatch):
+    finished = []
+
+    def slow_board(query, location, timeout):
+        # A board that never answers; like requests, the fetch gives up after `timeout`
+        time.sleep(timeout)
+        finished.append(time.monotonic())
+        return []
+
+    # One busy thread: the second board only starts once the first has timed out
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(scrape_jobs_tool, "_fetch_pool", pool)
+    monkeypatch.setattr(scrape_jobs_tool, "SOURCES", [("First", slow_board, 0.3), ("Second", slow_board, 10.0)])
+    started = time.monotonic()
+    assert scrape_jobs_tool.fetch_all_sources("python", "Remote", deadline=0.5) == []
+    pool.shutdown(wait=True)
+    # The second fetch only gets what is left of the deadline, not a fresh 0.5 s
+    assert max(finished) - started < 0.65
+
+
+def test_repeat_tool_calls_do_not_reuse_job_ids(monkeypatch):
+    boards = {
+        "python": [{"title": "Python Engineer", "company": "Acme", "location": "Remote", "link": "https://jobicy.com/jobs/1"}],
+        "rust": [{"title": "Rust Engineer", "company": "Globex", "location": "Remote", "link": "https://jobicy.com/jobs/2"}],
+    }
+    monkeypatch.setattr(scrape_jobs_tool, "fetch_jobs", lambda query, location=None, on_source=None: list(boards[query]))
+    catalog = {}
+    tool = scrape_jobs_tool.ScrapeJobsTool(on_catalog=catalog.update)
+
+    first = tool._run("python", "Remote")
+    second = tool._run("rust", "Remote")
+
+    assert [job["id"] for job in first + second] == ["j1", "j2"]
+    assert {job_id: job["title"] for job_id, job in catalog.items()} == {"j1": "Python Engineer", "j2": "Rust Engineer"}